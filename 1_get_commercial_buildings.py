@@ -4,6 +4,7 @@ from shapely import wkb, wkt
 import duckdb
 import logging
 import os
+from octant_to_latlong import latlon_to_octant
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -95,7 +96,11 @@ gdf = gdf.to_crs(epsg=3857)
 gdf['area_sqft'] = gdf['geometry'].area * 10.7639
 
 # Filter buildings with area greater than 50,000 square feet
-filtered_gdf = gdf[gdf['area_sqft'] > 12000]
+filtered_gdf = gdf[gdf['area_sqft'] > 12000].copy()
+
+# Tag each building with the level-16 octant (one bulk packet) of its centroid for spatial joins
+centroids = filtered_gdf.geometry.centroid.to_crs(epsg=4326)
+filtered_gdf['octant_16'] = latlon_to_octant(centroids.y, centroids.x, 16)
 
 # set the CRS back to 4326
 filtered_gdf = filtered_gdf.to_crs(epsg=4326)
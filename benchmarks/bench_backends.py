@@ -0,0 +1,44 @@
+"""Time rocktree_pb2 parsing under every protobuf backend that is installed.
+
+    python -m benchmarks.bench_backends [recorded BulkMetadata files...]
+
+Each backend runs in its own interpreter because the backend is picked
+from PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION when protobuf is imported.
+"""
+import os
+import subprocess
+import sys
+
+BACKENDS = ["python", "upb", "cpp"]
+
+
+def run_backend():
+    from google.protobuf.internal import api_implementation
+
+    from benchmarks.payloads import bulk_payloads
+    from benchmarks.payloads import synthetic_node_data
+    from benchmarks.payloads import timeit
+    from proto.rocktree_pb2 import BulkMetadata
+    from proto.rocktree_pb2 import NodeData
+
+    _, bulks = bulk_payloads(sys.argv[2:])
+    nodes = [synthetic_node_data(seed=seed) for seed in range(8)]
+    bulk_time = timeit(lambda data: BulkMetadata().ParseFromString(data), bulks)
+    node_time = timeit(lambda data: NodeData().ParseFromString(data), nodes)
+    print(f"{api_implementation.Type():8} BulkMetadata {bulk_time * 1e3:8.2f} ms   "
+          f"NodeData {node_time * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--backend"]:
+        run_backend()
+        sys.exit()
+    for backend in BACKENDS:
+        env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_backends", "--backend", *sys.argv[1:]],
+            env=env, capture_output=True, text=True)
+        if result.returncode:
+            print(f"{backend:8} not available")
+        else:
+            print(result.stdout, end="")
@@ -0,0 +1,31 @@
+"""Time decoding bulk packets into overlap columns, fully parsed versus lazily.
+
+    python -m benchmarks.bench_bulk_metadata [recorded BulkMetadata files...]
+"""
+from google.protobuf.internal import api_implementation
+
+from benchmarks.payloads import bulk_payloads
+from benchmarks.payloads import timeit
+from bulk_columns import decode_bulk_metadata
+from bulk_metadata import LazyBulkMetadata
+from proto.rocktree_pb2 import BulkMetadata
+
+
+def parse_full(data):
+    bulk = BulkMetadata()
+    bulk.ParseFromString(data)
+    decode_bulk_metadata(bulk)
+
+
+def parse_lazy(data):
+    decode_bulk_metadata(LazyBulkMetadata(data))
+
+
+if __name__ == "__main__":
+    kind, payloads = bulk_payloads()
+    print(f"{len(payloads)} {kind} packets, {sum(map(len, payloads))} bytes, "
+          f"protobuf backend: {api_implementation.Type()}")
+    baseline = timeit(parse_full, payloads)
+    print(f"ParseFromString + columns    {baseline * 1e3:8.2f} ms")
+    elapsed = timeit(parse_lazy, payloads)
+    print(f"LazyBulkMetadata + columns   {elapsed * 1e3:8.2f} ms  ({baseline / elapsed:.1f}x)")
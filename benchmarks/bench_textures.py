@@ -0,0 +1,61 @@
+"""Compare texture extraction with the byte-slicing extractor main.py used before.
+
+    python -m benchmarks.bench_textures [recorded NodeData files...]
+"""
+from benchmarks.payloads import node_data_payloads
+from benchmarks.payloads import timeit
+from wire import decode_varint
+from wire import iter_textures
+
+
+def legacy_extract_jpeg(data):
+    """main._extract_jpeg_from_protobuf before wire.iter_textures, without its prints."""
+    pos = 0
+    while pos < len(data):
+        tag, new_pos = decode_varint(data, pos)
+        wire_type = tag & 7
+        field_number = tag >> 3
+        if wire_type == 2:
+            length, content_pos = decode_varint(data, new_pos)
+            content = data[content_pos:content_pos + length]
+            if field_number == 2:
+                nested_pos = 0
+                while nested_pos < len(content):
+                    nested_tag, nested_new_pos = decode_varint(content, nested_pos)
+                    nested_wire_type = nested_tag & 7
+                    nested_field_number = nested_tag >> 3
+                    if nested_wire_type == 2:
+                        nested_length, nested_content_pos = decode_varint(content, nested_new_pos)
+                        nested_content = content[nested_content_pos:nested_content_pos + nested_length]
+                        if nested_field_number == 6:
+                            jpeg_data = nested_content[3:]
+                            if jpeg_data.startswith(b'\xFF\xD8'):
+                                return jpeg_data
+                        nested_pos = nested_content_pos + nested_length
+                    else:
+                        nested_pos = nested_new_pos
+            pos = content_pos + length
+        else:
+            pos = new_pos
+    return None
+
+
+def first_texture(data):
+    for texture in iter_textures(data):
+        return texture.data
+
+
+def all_textures(data):
+    for _ in iter_textures(data):
+        pass
+
+
+if __name__ == "__main__":
+    kind, payloads = node_data_payloads()
+    print(f"{len(payloads)} {kind} NodeData payloads, {sum(map(len, payloads))} bytes")
+    baseline = timeit(legacy_extract_jpeg, payloads, repeat=20)
+    print(f"legacy extractor           {baseline * 1e3:8.3f} ms")
+    for name, function in [("iter_textures, first", first_texture),
+                            ("iter_textures, all", all_textures)]:
+        elapsed = timeit(function, payloads, repeat=20)
+        print(f"{name:26} {elapsed * 1e3:8.3f} ms  ({baseline / elapsed:.1f}x)")
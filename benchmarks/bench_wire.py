@@ -0,0 +1,29 @@
+"""Compare the wire walker with a full BulkMetadata parse.
+
+    python -m benchmarks.bench_wire [recorded BulkMetadata files...]
+"""
+from google.protobuf.internal import api_implementation
+
+from benchmarks.payloads import bulk_payloads
+from benchmarks.payloads import timeit
+from proto.rocktree_pb2 import BulkMetadata
+from wire import iter_bulk_nodes
+
+
+def parse_full(data):
+    BulkMetadata().ParseFromString(data)
+
+
+def walk(data):
+    for _ in iter_bulk_nodes(data):
+        pass
+
+
+if __name__ == "__main__":
+    kind, payloads = bulk_payloads()
+    print(f"{len(payloads)} {kind} packets, {sum(map(len, payloads))} bytes, "
+          f"protobuf backend: {api_implementation.Type()}")
+    baseline = timeit(parse_full, payloads)
+    print(f"BulkMetadata.ParseFromString  {baseline * 1e3:8.2f} ms")
+    elapsed = timeit(walk, payloads)
+    print(f"wire.iter_bulk_nodes          {elapsed * 1e3:8.2f} ms  ({baseline / elapsed:.1f}x)")
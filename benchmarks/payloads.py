@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+from metadata_cache import DEFAULT_CACHE_DIR
+from proto.rocktree_pb2 import BulkMetadata
+from proto.rocktree_pb2 import NodeData
+from proto.rocktree_pb2 import Texture
+
+
+def synthetic_bulk_metadata(head_path="2052706160527351", epoch=990, seed=0):
+    """Serialized BulkMetadata shaped like a full packet: four levels below the head."""
+    rng = random.Random(seed)
+    bulk = BulkMetadata()
+    bulk.head_node_key.path = head_path
+    bulk.head_node_key.epoch = epoch
+    bulk.head_node_center.extend([rng.uniform(-1, 1) for _ in range(3)])
+    bulk.meters_per_texel.extend([2.0 ** -i for i in range(5)])
+    bulk.default_imagery_epoch = 300
+    bulk.default_available_texture_formats = 6
+    paths = [""]
+    for _ in range(4):
+        paths = [path + str(digit) for path in paths for digit in range(4)]
+        for path in paths:
+            node = bulk.node_metadata.add()
+            value = len(path) - 1
+            for i, digit in enumerate(path):
+                value |= int(digit) << (2 + 3 * i)
+            node.path_and_flags = value | rng.choice([0, 0, 0, 8, 16]) << (2 + 3 * len(path))
+            node.epoch = epoch - rng.randrange(3)
+            node.oriented_bounding_box = rng.randbytes(15)
+            node.meters_per_texel = rng.uniform(0.1, 10)
+            if rng.random() < 0.3:
+                node.imagery_epoch = 300 + rng.randrange(50)
+            if len(path) == 4:
+                node.bulk_metadata_epoch = epoch + 1
+    return bulk.SerializeToString()
+
+
+def synthetic_node_data(path="20527061605273514160", seed=0):
+    """Serialized NodeData with one textured mesh per altitude octant, sized like a real tile."""
+    rng = random.Random(seed)
+    node = NodeData()
+    node.node_key.path = path
+    node.node_key.epoch = 990
+    node.matrix_globe_from_mesh.extend([rng.uniform(-1, 1) for _ in range(16)])
+    for _ in range(2):
+        mesh = node.meshes.add()
+        mesh.vertices = rng.randbytes(3 * 2000)
+        mesh.texture_coords = rng.randbytes(4 + 4 * 2000)
+        mesh.indices = rng.randbytes(3000)
+        mesh.layer_and_octant_counts = rng.randbytes(12)
+        texture = mesh.texture.add()
+        texture.data.append(b"\xff\xd8" + rng.randbytes(20000) + b"\xff\xd9")
+        texture.format = Texture.JPG
+        texture.width = texture.height = 256
+    return node.SerializeToString()
+
+
+def bulk_payloads(args=None):
+    """Recorded BulkMetadata files named in `args`, else the metadata cache, else a synthetic packet."""
+    args = sys.argv[1:] if args is None else args
+    files = [Path(arg) for arg in args]
+    if not files:
+        files = [file for file in Path(DEFAULT_CACHE_DIR).glob("*/*.pb")
+                 if not file.name.startswith("PlanetoidMetadata")]
+    if files:
+        return "recorded", [file.read_bytes() for file in files]
+    return "synthetic", [synthetic_bulk_metadata(seed=seed) for seed in range(8)]
+
+
+def node_data_payloads(args=None):
+    """Recorded NodeData files named in `args`, else synthetic tiles."""
+    args = sys.argv[1:] if args is None else args
+    if args:
+        return "recorded", [Path(arg).read_bytes() for arg in args]
+    return "synthetic", [synthetic_node_data(seed=seed) for seed in range(8)]
+
+
+def timeit(function, payloads, repeat=5):
+    """Best wall time of `repeat` passes of `function` over all payloads."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            function(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
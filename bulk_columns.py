@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+import numpy as np
+
+from bulk_metadata import node_column
+from octant_keys import DIGIT_SHIFTS
+from octant_keys import MAX_LEVEL
+from octant_keys import pack_path
+from octant_keys import unpack_path
+from octant_to_latlong import octant_to_latlong_batch
+
+
+class BulkColumns(namedtuple("BulkColumns", [
+        "bulk", "path", "level", "flags", "epoch", "north", "south", "west", "east"])):
+    """Column view of the `node_metadata` of one `BulkMetadata` or `LazyBulkMetadata`.
+
+    Row i describes `bulk.node_metadata[i]`. `path` holds packed octant
+    paths, `epoch` is the epoch of the bulk packet below each node. `bulk`
+    is None for columns that were not decoded from a protobuf message.
+    """
+
+    def __len__(self):
+        return len(self.path)
+
+    def path_string(self, i):
+        return unpack_path(int(self.path[i]))
+
+    def overlaps(self, box):
+        n, s, w, e = box
+        return ((np.minimum(self.north, n) >= np.maximum(self.south, s))
+                & (np.maximum(self.west, w) <= np.minimum(self.east, e)))
+
+
+def decode_bulk_metadata(bulk):
+    head_path = bulk.head_node_key.path
+    head_level = len(head_path)
+
+    path_and_flags = node_column(bulk, "path_and_flags").astype(np.uint64)
+    count = len(path_and_flags)
+    epoch = node_column(bulk, "bulk_metadata_epoch").astype(np.uint32)
+    epoch[epoch == 0] = bulk.head_node_key.epoch
+
+    relative_level = (path_and_flags & 3).astype(np.int64) + 1
+    digits = [(path_and_flags >> np.uint64(2 + 3 * i)) & np.uint64(7) for i in range(4)]
+    flags = (path_and_flags >> (2 + 3 * relative_level).astype(np.uint64)).astype(np.uint32)
+    level = relative_level + head_level
+    if count and level.max() > MAX_LEVEL:
+        raise ValueError(f"octant path longer than {MAX_LEVEL} levels under {head_path}")
+
+    path = np.full(count, pack_path(head_path) - head_level, dtype=np.uint64)
+    path += level.astype(np.uint64)
+    for i, digit in enumerate(digits):
+        if head_level + i < MAX_LEVEL:
+            shift = np.uint64(DIGIT_SHIFTS[head_level + i])
+            path |= np.where(relative_level > i, digit << shift, np.uint64(0))
+
+    n, s, w, e = octant_to_latlong_batch(path, prefix=head_path)
+    return BulkColumns(bulk, path, level.astype(np.uint8), flags, epoch, n, s, w, e)
@@ -0,0 +1,116 @@
+from collections import namedtuple
+
+import numpy as np
+from google.protobuf.internal import api_implementation
+
+from proto.rocktree_pb2 import BulkMetadata
+from wire import BULK_HEAD_NODE_KEY
+from wire import decode_node_fields
+from wire import read_node_key
+from wire import split_bulk_metadata
+
+NodeKey = namedtuple("NodeKey", ["path", "epoch"])
+
+# Scalar NodeMetadata fields that can be decoded into columns.
+NODE_FIELDS = {
+    "path_and_flags": (1, np.uint32),
+    "epoch": (2, np.uint32),
+    "meters_per_texel": (4, np.float32),
+    "bulk_metadata_epoch": (5, np.uint32),
+    "imagery_epoch": (7, np.uint32),
+    "available_texture_formats": (8, np.uint32),
+    "available_view_dependent_textures": (9, np.uint32),
+    "available_view_dependent_texture_formats": (10, np.uint32),
+}
+OVERLAP_FIELDS = ("path_and_flags", "epoch", "bulk_metadata_epoch")
+IMAGERY_FIELDS = OVERLAP_FIELDS + ("imagery_epoch", "available_texture_formats")
+
+# "python", "upb" or "cpp", chosen by protobuf from the environment variable
+# PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION. Native backends parse whole packets
+# faster than LazyBulkMetadata picks fields out in python.
+PROTOBUF_BACKEND = api_implementation.Type()
+
+_DEFAULTS = {
+    5: "default_imagery_epoch",
+    6: "default_available_texture_formats",
+    7: "default_available_view_dependent_textures",
+    8: "default_available_view_dependent_texture_formats",
+}
+
+
+class LazyBulkMetadata:
+    """Serialized BulkMetadata that decodes node fields only when asked.
+
+    Construction finds the node messages and decodes `fields` into columns.
+    Other scalar fields are decoded by `node_column` on first use, and the
+    full protobuf message is only parsed for `node_metadata` and friends.
+    """
+
+    def __init__(self, data, fields=OVERLAP_FIELDS):
+        self.data = data
+        self._message = None
+        self._columns = {}
+        self._starts, self._ends, top_level = split_bulk_metadata(data)
+        head = top_level.get(BULK_HEAD_NODE_KEY)
+        self.head_node_key = NodeKey("", 0) if head is None else NodeKey(*read_node_key(head))
+        for number, name in _DEFAULTS.items():
+            value = top_level.get(number, 0)
+            setattr(self, name, value if isinstance(value, int) else 0)
+        self._decode(fields)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def node_column(self, name):
+        """Array holding field `name` of every node, 0 where unset."""
+        if name not in self._columns:
+            self._decode([name])
+        return self._columns[name]
+
+    def _decode(self, names):
+        columns = decode_node_fields(self.data, self._starts, self._ends,
+                                     [NODE_FIELDS[name][0] for name in names])
+        for name in names:
+            number, dtype = NODE_FIELDS[name]
+            self._columns[name] = np.array(columns[number], dtype=dtype)
+
+    @property
+    def message(self):
+        """The fully parsed `BulkMetadata`."""
+        if self._message is None:
+            self._message = BulkMetadata()
+            self._message.ParseFromString(self.data)
+        return self._message
+
+    @property
+    def node_metadata(self):
+        return self.message.node_metadata
+
+    @property
+    def head_node_center(self):
+        return self.message.head_node_center
+
+    @property
+    def meters_per_texel(self):
+        return self.message.meters_per_texel
+
+
+def parse_bulk_metadata(data, fields=OVERLAP_FIELDS):
+    """Decode a BulkMetadata packet the fastest way the protobuf backend allows.
+
+    With the python backend only the node `fields` are decoded up front.
+    """
+    if PROTOBUF_BACKEND == "python":
+        return LazyBulkMetadata(data, fields)
+    bulk = BulkMetadata()
+    bulk.ParseFromString(data)
+    return bulk
+
+
+def node_column(bulk, name):
+    """Field `name` of every node of a `LazyBulkMetadata` or `BulkMetadata`."""
+    if isinstance(bulk, LazyBulkMetadata):
+        return bulk.node_column(name)
+    nodes = bulk.node_metadata
+    return np.fromiter((getattr(node, name) for node in nodes),
+                       dtype=NODE_FIELDS[name][1], count=len(nodes))
@@ -0,0 +1,43 @@
+from collections import namedtuple
+
+DownloadPlan = namedtuple("DownloadPlan", ["octants", "nodata", "leaves"])
+DownloadPlan.__doc__ = """Octants to request NodeData for.
+
+`nodata` lists the octants skipped because their NODATA flag is set, and
+`leaves` the octants above the target level taken because the tree ends
+there.
+"""
+
+
+def plan_octant(octant, level):
+    """How `plan_downloads` treats one octant: "octant", "leaf", "nodata" or None."""
+    if octant.level > level or octant.level < level and not octant.is_leaf:
+        return None
+    if octant.is_nodata:
+        return "nodata"
+    return "leaf" if octant.level < level else "octant"
+
+
+def plan_downloads(overlaps, level=None):
+    """Choose the octants of `overlaps` worth requesting NodeData for.
+
+    Takes every octant at `level` (default: the deepest level found) and
+    every leaf above it, since nothing below a leaf can be requested.
+    Octants flagged NODATA are left out.
+    """
+    if level is None:
+        level = max(overlaps, default=0)
+    octants, nodata, leaves = [], [], []
+    for octant_level in sorted(overlaps):
+        if octant_level > level:
+            break
+        for octant in overlaps[octant_level]:
+            kind = plan_octant(octant, level)
+            if kind == "nodata":
+                nodata.append(octant)
+                continue
+            if kind == "leaf":
+                leaves.append(octant)
+            if kind is not None:
+                octants.append(octant)
+    return DownloadPlan(octants, nodata, leaves)
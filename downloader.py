@@ -0,0 +1,151 @@
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from urllib.parse import urlsplit
+
+import requests
+
+from find_overlaps import PLANET
+from transport import get_transport
+
+JPG = 1
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Request errors worth another attempt; any other RequestException fails the tile.
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout,
+                requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+TileKey = namedtuple("TileKey", ["path", "epoch", "imagery_version", "timestamp"])
+# status is "ok", "missing" (404) or "failed"; data is the NodeData payload when ok.
+TileResult = namedtuple("TileResult", ["key", "status", "data", "attempts", "error"])
+
+
+def node_data_resource(key, texture_format=JPG):
+    return (f"tm/{PLANET}/NodeData/pb=!1m2!1s{key.path}!2u{key.epoch}!2e{texture_format}"
+            f"!3u{key.imagery_version}!4b0!5i{key.timestamp}")
+
+
+class TokenBucket:
+    """Blocking rate limiter: `rate` requests per second, bursts of up to `burst`."""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        # Take a token even when the bucket is empty and sleep off the debt,
+        # so concurrent callers queue up in order instead of polling.
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            self._sleep(wait)
+
+
+class Downloader:
+    """Fetches NodeData tiles concurrently, with retries and a per-host rate limit.
+
+    Connection errors, timeouts, truncated bodies, 429 and 5xx responses are
+    retried with exponential backoff and jitter; other request errors fail
+    the tile without aborting the rest. A 404 means the tile does not exist and
+    is reported as "missing" straight away. With a `TileStore`, payloads are
+    read through it and results served from it report 0 attempts. At most
+    `window` tiles (default twice `concurrency`) are in flight or waiting to
+    be yielded at a time.
+    """
+
+    def __init__(self, transport=None, concurrency=8, retries=4, backoff=0.5, max_backoff=30.0,
+                 rate=20.0, burst=8, store=None, sleep=time.sleep, window=None):
+        self.transport = transport
+        self.store = store
+        self.concurrency = concurrency
+        self.window = window or 2 * concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.rate = rate
+        self.burst = burst
+        self._sleep = sleep
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst, sleep=self._sleep)
+            return self._buckets[host]
+
+    def _delay(self, attempt, response=None):
+        retry_after = response is not None and response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return min(self.backoff * 2 ** attempt, self.max_backoff) * random.uniform(0.5, 1)
+
+    def fetch(self, key):
+        """Fetch one tile, retrying transient failures, and return a `TileResult`."""
+        if self.store is not None:
+            data = self.store.get(key)
+            if data is not None:
+                return TileResult(key, "ok", data, 0, None)
+        transport = self.transport or get_transport()
+        resource = node_data_resource(key)
+        bucket = self._bucket(transport.url(resource))
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._sleep(self._delay(attempt - 1, response))
+            bucket.acquire()
+            response = None
+            try:
+                response = transport.get(resource)
+            except RETRY_ERRORS as e:
+                error = e
+                continue
+            except requests.RequestException as e:
+                return TileResult(key, "failed", None, attempt + 1, e)
+            if response.status_code == 200:
+                if self.store is not None:
+                    self.store.put(key, response.content)
+                return TileResult(key, "ok", response.content, attempt + 1, None)
+            if response.status_code == 404:
+                return TileResult(key, "missing", None, attempt + 1, None)
+            error = requests.HTTPError(f"{response.status_code} for {resource}", response=response)
+            if response.status_code not in RETRY_STATUSES:
+                return TileResult(key, "failed", None, attempt + 1, error)
+        return TileResult(key, "failed", None, self.retries + 1, error)
+
+    def download(self, keys):
+        """Yield a `TileResult` for every key as soon as it completes.
+
+        `keys` may be a generator: keys are taken from it as earlier tiles
+        complete, keeping `window` of them in flight, so downloads run while
+        the generator is still producing keys and results come back from the
+        start.
+        """
+        keys = iter(keys)
+        executor = ThreadPoolExecutor(self.concurrency)
+        pending = set()
+        try:
+            while True:
+                for key in islice(keys, self.window - len(pending)):
+                    pending.add(executor.submit(self.fetch, key))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
@@ -1,33 +1,57 @@
 import sys
 from collections import defaultdict
-from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
+from bulk_columns import decode_bulk_metadata
+from bulk_metadata import IMAGERY_FIELDS
+from bulk_metadata import OVERLAP_FIELDS
+from bulk_metadata import parse_bulk_metadata
+from metadata_cache import MetadataCache
+from octant_keys import key_level
+from octant_keys import pack_path
+from octant_keys import planar_path
+from octant_keys import unpack_path
 from octant_to_latlong import LatLonBox
+from octant_to_latlong import cover_region
 from octant_to_latlong import octant_to_latlong
-from proto.rocktree_pb2 import BulkMetadata
+from proto.rocktree_pb2 import NodeMetadata
 from proto.rocktree_pb2 import PlanetoidMetadata
+from transport import get_transport
 
 PLANET = "earth"
-URL_PREFIX = f"https://kh.google.com/rt/{PLANET}/"
+RESOURCE_PREFIX = f"{PLANET}/"
+PLANETOID_METADATA_MAX_AGE = 24 * 60 * 60
+
+metadata_cache = MetadataCache()
+# Set to an ImageryIndex to index the imagery of every bulk packet read.
+imagery_index = None
+
+
+def urlread(resource):
+    return get_transport().read(resource)
 
 
-def urlread(url):
-    with urlopen(url) as f:
-        return f.read()
+def cached_urlread(resource, path, epoch, max_age=None):
+    if metadata_cache is None:
+        return urlread(resource)
+    return metadata_cache.fetch(PLANET, path, epoch, lambda: urlread(resource), max_age=max_age)
 
 
 def read_planetoid_metadata():
-    url = URL_PREFIX + "PlanetoidMetadata"
+    resource = RESOURCE_PREFIX + "PlanetoidMetadata"
     metadata = PlanetoidMetadata()
-    metadata.ParseFromString(urlread(url))
+    metadata.ParseFromString(cached_urlread(
+        resource, "PlanetoidMetadata", None, max_age=PLANETOID_METADATA_MAX_AGE))
     return metadata
 
 
 def read_bulk_metadata(path, epoch):
-    url = URL_PREFIX + f"BulkMetadata/pb=!1m2!1s{path}!2u{epoch}"
-    metadata = BulkMetadata()
-    metadata.ParseFromString(urlread(url))
-    return metadata
+    resource = RESOURCE_PREFIX + f"BulkMetadata/pb=!1m2!1s{path}!2u{epoch}"
+    # The fields the imagery index needs come out of the same decoding pass
+    fields = OVERLAP_FIELDS if imagery_index is None else IMAGERY_FIELDS
+    return parse_bulk_metadata(cached_urlread(resource, path, epoch), fields)
 
 
 def parse_path_and_flags(data):
@@ -47,51 +71,280 @@ def parse_path_and_flags(data):
 
 
 class Octant:
-    def __init__(self, head_node_key, node_data):
-        self.head_node_key = head_node_key
-        self.node_data = node_data
+    """One rocktree node, kept small: a packed path key, flags, epoch and box."""
+
+    __slots__ = ("key", "flags", "epoch", "north", "south", "west", "east")
 
-        path, flags = parse_path_and_flags(self.node_data.path_and_flags)
-        self.path = self.head_node_key.path + path
+    def __init__(self, head_node_key, node_data):
+        path, flags = parse_path_and_flags(node_data.path_and_flags)
+        path = head_node_key.path + path
+        self.key = pack_path(path)
         self.flags = flags
 
-        self.epoch = self.node_data.bulk_metadata_epoch
+        self.epoch = node_data.bulk_metadata_epoch
         if self.epoch == 0:
-            self.epoch = self.head_node_key.epoch
+            self.epoch = head_node_key.epoch
+
+        self.north, self.south, self.west, self.east = octant_to_latlong(path)
+
+    @classmethod
+    def from_columns(cls, columns, i):
+        octant = cls.__new__(cls)
+        octant.key = int(columns.path[i])
+        octant.flags = int(columns.flags[i])
+        octant.epoch = int(columns.epoch[i])
+        octant.north = float(columns.north[i])
+        octant.south = float(columns.south[i])
+        octant.west = float(columns.west[i])
+        octant.east = float(columns.east[i])
+        return octant
+
+    @property
+    def path(self):
+        return unpack_path(self.key)
+
+    @property
+    def level(self):
+        return key_level(self.key)
 
-        self.level = len(self.path)
-        self.bbox = octant_to_latlong(self.path)
+    @property
+    def bbox(self):
+        return LatLonBox(self.north, self.south, self.west, self.east)
 
     @property
     def is_leaf(self):
-        return bool(self.flags & 4)
+        return bool(self.flags & NodeMetadata.LEAF)
+
+    @property
+    def is_nodata(self):
+        return bool(self.flags & NodeMetadata.NODATA)
+
+    @property
+    def is_rich3d_leaf(self):
+        return bool(self.flags & NodeMetadata.RICH3D_LEAF)
+
+    @property
+    def is_rich3d_nodata(self):
+        return bool(self.flags & NodeMetadata.RICH3D_NODATA)
+
+    @property
+    def uses_imagery_epoch(self):
+        return bool(self.flags & NodeMetadata.USE_IMAGERY_EPOCH)
+
+    def __eq__(self, other):
+        if not isinstance(other, Octant):
+            return NotImplemented
+        return self.key == other.key and self.epoch == other.epoch
+
+    def __hash__(self):
+        return hash((self.key, self.epoch))
+
+    def __repr__(self):
+        return f"Octant({self.path!r}, epoch={self.epoch}, flags={self.flags})"
+
+
+def read_bulk_metadata_many(keys, executor=None):
+    """Lazily read bulk packets in the order of `keys`."""
+    if executor is None or len(keys) < 2:
+        return (read_bulk_metadata(path, epoch) for path, epoch in keys)
+    return executor.map(lambda key: read_bulk_metadata(*key), keys)
 
 
-def find_overlaps(bbox, max_octants_per_level):
-    planetoid_metadata = read_planetoid_metadata()
-    root_epoch = planetoid_metadata.root_node_metadata.epoch
+def read_bulk_columns_many(keys, executor=None, snapshot=None):
+    if snapshot is not None:
+        return (snapshot.bulk_columns(path, epoch) for path, epoch in keys)
+    return map(_decode_and_index, read_bulk_metadata_many(keys, executor))
 
-    overlapping_octants = defaultdict(list)
 
-    def update_overlapping_octants(path, head_node_epoch):
-        bulk = read_bulk_metadata(path, head_node_epoch)
-        for node_data in bulk.node_metadata:
-            octant = Octant(bulk.head_node_key, node_data)
-            if octant.bbox.overlaps_with(bbox):
-                overlapping_octants[octant.level].append(octant)
+def _decode_and_index(bulk):
+    columns = decode_bulk_metadata(bulk)
+    if imagery_index is not None:
+        imagery_index.add_columns(columns)
+    return columns
 
-    update_overlapping_octants("", root_epoch)
-    for level in range(1, 21):
-        if len(overlapping_octants[level]) >= max_octants_per_level:
-            break
-        if level % 4 == 0:
-            for octant in overlapping_octants[level]:
-                if not octant.is_leaf:
-                    update_overlapping_octants(octant.path, octant.epoch)
 
+def is_geometry(region):
+    return hasattr(region, "geom_type")
+
+
+def region_masks(columns, region, min_overlap=0.0):
+    """Return (intersects, selected) masks of the rows of `columns`.
+
+    `region` is a `LatLonBox` or a shapely geometry in lon/lat. A row is
+    selected when at least `min_overlap` of its box area lies inside the
+    region; traversal continues below every intersecting row.
+    """
+    if not is_geometry(region):
+        intersects = columns.overlaps(region)
+        if min_overlap <= 0:
+            return intersects, intersects
+        n, s, w, e = region
+        height = np.minimum(columns.north, n) - np.maximum(columns.south, s)
+        width = np.minimum(columns.east, e) - np.maximum(columns.west, w)
+        area = (columns.north - columns.south) * (columns.east - columns.west)
+        fraction = height.clip(0) * width.clip(0) / area
+        return intersects, intersects & (fraction >= min_overlap)
+
+    import shapely
+
+    west, south, east, north = region.bounds
+    intersects = columns.overlaps(LatLonBox(north, south, west, east))
+    candidates = np.flatnonzero(intersects)
+    if len(candidates) == 0:
+        return intersects, intersects
+    shapely.prepare(region)
+    boxes = shapely.box(columns.west[candidates], columns.south[candidates],
+                        columns.east[candidates], columns.north[candidates])
+    intersects[candidates] = shapely.intersects(boxes, region)
+    if min_overlap <= 0:
+        return intersects, intersects
+    fraction = shapely.area(shapely.intersection(boxes, region)) / shapely.area(boxes)
+    selected = np.zeros_like(intersects)
+    selected[candidates] = intersects[candidates] & (fraction >= min_overlap)
+    return intersects, selected
+
+
+class Overlaps(defaultdict):
+    """Overlapping octants by level, plus the number of bulk packets read."""
+
+    def __init__(self):
+        super().__init__(list)
+        self.bulk_fetches = 0
+
+
+def find_overlaps(bbox, max_octants_per_level=None, concurrency=1, min_overlap=0.0,
+                  target_level=None, snapshot=None, leaves=False):
+    return find_overlaps_many([bbox], max_octants_per_level, concurrency, min_overlap,
+                              target_level, snapshot, leaves)[0]
+
+
+def find_overlaps_many(bboxes, max_octants_per_level=None, concurrency=1, min_overlap=0.0,
+                       target_level=None, snapshot=None, leaves=False):
+    """Walk the octant tree once for all `bboxes`.
+
+    Each entry is a `LatLonBox` or a shapely geometry, see `region_masks`.
+    Returns one `Overlaps` result per entry. A bulk packet is fetched at
+    most once and only the entries that requested it see its nodes, so
+    every result matches a separate `find_overlaps` call.
+
+    By default the walk stops at the first level holding at least
+    `max_octants_per_level` octants. With `target_level` it instead lists
+    every octant at that level, descending only the bulk packets needed for
+    it, and the results hold that level alone. With `leaves` they also hold
+    the leaf octants above `target_level`, where the tree ends early.
+
+    With a `snapshot.Snapshot` the walk reads bulk packets from the snapshot
+    instead of the network.
+    """
+    overlapping_octants = [Overlaps() for _ in bboxes]
+    for _ in _walk(bboxes, max_octants_per_level, concurrency, min_overlap, target_level,
+                   snapshot, overlapping_octants, leaves):
+        pass
     return overlapping_octants
 
 
+def iter_overlaps(bbox, max_octants_per_level=None, concurrency=1, min_overlap=0.0,
+                  target_level=None, snapshot=None, leaves=False):
+    """Yield the octants `find_overlaps` would return as soon as they are decoded."""
+    for octant, _ in iter_overlaps_many([bbox], max_octants_per_level, concurrency,
+                                        min_overlap, target_level, snapshot, leaves):
+        yield octant
+
+
+def iter_overlaps_many(bboxes, max_octants_per_level=None, concurrency=1, min_overlap=0.0,
+                       target_level=None, snapshot=None, leaves=False):
+    """Yield (octant, indices of the matching `bboxes`) while walking the tree."""
+    overlapping_octants = [Overlaps() for _ in bboxes]
+    yield from _walk(bboxes, max_octants_per_level, concurrency, min_overlap, target_level,
+                     snapshot, overlapping_octants, leaves)
+
+
+def find_covering(bbox, level, concurrency=1, snapshot=None):
+    """Match the geometric covering of `bbox` at `level` against the tree.
+
+    Returns {candidate path: octants}. Candidates come from `cover_region`
+    without any network access; a `target_level` walk then finds which of
+    them exist, with their epochs. That walk reads the same bulk packets as
+    `find_overlaps(bbox, target_level=level)`: the candidates cannot prune
+    it further, since every bulk packet it reads is on the way to one.
+    An empty list marks a candidate the tree has no octant for.
+    """
+    covering = {path: [] for path in cover_region(bbox, level)}
+    for octant in iter_overlaps(bbox, target_level=level, concurrency=concurrency,
+                                snapshot=snapshot):
+        covering.setdefault(planar_path(octant.path), []).append(octant)
+    return covering
+
+
+def _walk(bboxes, max_octants_per_level, concurrency, min_overlap, target_level, snapshot,
+          overlapping_octants, leaves=False):
+    if target_level is None and max_octants_per_level is None:
+        raise ValueError("either max_octants_per_level or target_level is required")
+    if target_level is not None and not 1 <= target_level <= 20:
+        raise ValueError(f"target_level must be between 1 and 20, got {target_level}")
+
+    if snapshot is not None:
+        for bbox in bboxes:
+            if not snapshot.covers(bbox):
+                raise ValueError(f"{bbox} is not inside snapshot prefix {snapshot.prefix!r}")
+        root_epoch = snapshot.root_epoch
+    else:
+        root_epoch = read_planetoid_metadata().root_node_metadata.epoch
+
+    octants_by_level = defaultdict(list)
+    active = [True] * len(bboxes)
+
+    def update_overlapping_octants(columns, requesters):
+        for i in requesters:
+            overlapping_octants[i].bulk_fetches += 1
+        masks = [(i, *region_masks(columns, bboxes[i], min_overlap)) for i in requesters]
+        wanted = np.logical_or.reduce([mask for _, mask, _ in masks])
+        if target_level is not None:
+            reported = columns.level == target_level
+            if leaves:
+                reported |= ((columns.flags & NodeMetadata.LEAF) != 0) & (columns.level < target_level)
+            wanted &= reported | ((columns.level % 4 == 0) & (columns.level < target_level))
+        for index in np.flatnonzero(wanted):
+            octant = Octant.from_columns(columns, index)
+            matches = [i for i, mask, _ in masks if mask[index]]
+            octants_by_level[octant.level].append((octant, matches))
+            if target_level is not None and not reported[index]:
+                continue
+            selected = [i for i, _, selected in masks if selected[index]]
+            for i in selected:
+                overlapping_octants[i][octant.level].append(octant)
+            if selected:
+                yield octant, selected
+
+    executor = ThreadPoolExecutor(concurrency) if concurrency > 1 and snapshot is None else None
+    try:
+        root, = read_bulk_columns_many([("", root_epoch)], snapshot=snapshot)
+        yield from update_overlapping_octants(root, range(len(bboxes)))
+        for level in range(1, 21):
+            if target_level is not None:
+                if level >= target_level:
+                    break
+            else:
+                for i, octants in enumerate(overlapping_octants):
+                    if len(octants[level]) >= max_octants_per_level:
+                        active[i] = False
+                if not any(active):
+                    break
+            if level % 4 == 0:
+                keys, requesters = [], []
+                for octant, matches in octants_by_level[level]:
+                    matches = [i for i in matches if active[i]]
+                    if matches and not octant.is_leaf:
+                        keys.append((octant.path, octant.epoch))
+                        requesters.append(matches)
+                bulks = read_bulk_columns_many(keys, executor, snapshot)
+                for columns, matches in zip(bulks, requesters):
+                    yield from update_overlapping_octants(columns, matches)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 def args_to_bbox(args):
     args = [float(x.rstrip(",")) for x in args]
     bottom, top = sorted([args[0], args[2]])
@@ -103,7 +356,7 @@ if __name__ == "__main__":
     bbox = args_to_bbox(sys.argv[1:5])
     print(bbox)
 
-    overlapping_octants = find_overlaps(bbox, max_octants_per_level=10)
+    overlapping_octants = find_overlaps(bbox, max_octants_per_level=10, concurrency=8)
     for level in sorted(overlapping_octants):
         print(f"[Octant level {level}]")
         for octant in overlapping_octants[level]:
@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from bulk_metadata import node_column
+from metadata_cache import DEFAULT_CACHE_DIR
+from octant_keys import unpack_paths
+from proto.rocktree_pb2 import NodeMetadata
+
+DEFAULT_INDEX_FILE = Path(DEFAULT_CACHE_DIR) / "imagery.sqlite"
+
+ImageryInfo = namedtuple("ImageryInfo", ["epoch", "imagery_epoch", "texture_formats", "flags"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    path TEXT PRIMARY KEY,
+    epoch INTEGER NOT NULL,
+    imagery_epoch INTEGER NOT NULL,
+    texture_formats INTEGER NOT NULL,
+    flags INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT NOT NULL,
+    imagery_epoch INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    available INTEGER NOT NULL,
+    PRIMARY KEY (path, imagery_epoch, timestamp)
+);
+"""
+
+
+class ImageryIndex:
+    """Persistent record of the imagery each octant has.
+
+    Bulk packets give every node's current imagery epoch, texture formats
+    and flags. They are kept in memory as they are added and written out in
+    one batch by `flush`, once `flush_rows` of them are waiting or when the
+    index is closed. NodeData requests for historical imagery (an imagery
+    epoch plus a timestamp) are recorded as they succeed or come back
+    missing, so later runs do not request combinations that are known not
+    to exist. Instances are safe to share between threads.
+    """
+
+    def __init__(self, filename=DEFAULT_INDEX_FILE, flush_rows=100_000):
+        self.filename = Path(filename)
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.filename, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.flush_rows = flush_rows
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+    def flush(self):
+        """Write the nodes added since the last flush, in a single transaction."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?)",
+                                     ((path, *info) for path, info in self._pending.items()))
+            self._pending.clear()
+
+    def add_columns(self, columns):
+        """Index every node of a decoded bulk packet."""
+        bulk = columns.bulk
+        imagery_epoch = node_column(bulk, "imagery_epoch")
+        imagery_epoch = np.where(imagery_epoch, imagery_epoch, bulk.default_imagery_epoch)
+        texture_formats = node_column(bulk, "available_texture_formats")
+        texture_formats = np.where(texture_formats, texture_formats,
+                                   bulk.default_available_texture_formats)
+        infos = zip(node_column(bulk, "epoch").tolist(), imagery_epoch.tolist(),
+                    texture_formats.tolist(), columns.flags.tolist())
+        with self._lock:
+            self._pending.update(zip(unpack_paths(columns.path).tolist(), map(ImageryInfo._make, infos)))
+            if len(self._pending) >= self.flush_rows:
+                self._flush()
+
+    def record(self, path, imagery_epoch, timestamp, available):
+        """Remember whether this imagery exists; False stops all later requests for it."""
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?)",
+                             (path, imagery_epoch, timestamp, int(available)))
+
+    def node(self, path):
+        with self._lock:
+            info = self._pending.get(path)
+            if info is not None:
+                return info
+            row = self._db.execute(
+                "SELECT epoch, imagery_epoch, texture_formats, flags FROM nodes WHERE path = ?",
+                (path,)).fetchone()
+        return None if row is None else ImageryInfo(*row)
+
+    def available(self, path):
+        """Known (imagery_epoch, timestamp) pairs of `path`.
+
+        The current imagery comes first with timestamp None, and imagery
+        epoch None unless the node has the USE_IMAGERY_EPOCH flag.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT imagery_epoch, timestamp FROM probes WHERE path = ? AND available"
+                " ORDER BY timestamp", (path,)).fetchall()
+        info = self.node(path)
+        if info is not None:
+            imagery_epoch = info.imagery_epoch if info.flags & NodeMetadata.USE_IMAGERY_EPOCH else None
+            rows.insert(0, (imagery_epoch, None))
+        return rows
+
+    def should_request(self, path, imagery_epoch, timestamp):
+        """False when `path` is known to lack this imagery, True otherwise.
+
+        Imagery is known to be missing once a request for it came back 404,
+        or up front when it is newer than the imagery epoch of the node.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT available FROM probes WHERE path = ? AND imagery_epoch = ? AND timestamp = ?",
+                (path, imagery_epoch, timestamp)).fetchone()
+        if row is not None:
+            return bool(row[0])
+        info = self.node(path)
+        return (info is None or not info.flags & NodeMetadata.USE_IMAGERY_EPOCH
+                or imagery_epoch <= info.imagery_epoch)
@@ -0,0 +1,137 @@
+import math
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bulk_metadata import node_column
+from find_overlaps import find_overlaps_many
+from find_overlaps import is_geometry
+from find_overlaps import read_bulk_columns_many
+from find_overlaps import read_planetoid_metadata
+from find_overlaps import region_masks
+from octant_to_latlong import cover_region
+from octant_to_latlong import octant_to_latlong
+
+TILE_SIZE = 256
+METERS_PER_DEGREE = 111_320.0
+# Nodes at this level sit in the bulk packets at level 12, which the walk
+# to any deeper target level reads again, from the metadata cache.
+SAMPLE_LEVEL = 16
+
+LevelChoice = namedtuple("LevelChoice", ["level", "tiles", "pixels", "meters_per_texel"])
+LevelChoice.__doc__ = """Octant level picked by `choose_level`.
+
+`tiles` is the number of octants covering the region at that level,
+`pixels` the estimated mosaic size in pixels along the region's longer
+side and `meters_per_texel` the texel size assumed for that level.
+"""
+
+
+def _bounds(region):
+    if is_geometry(region):
+        west, south, east, north = region.bounds
+        return north, south, west, east
+    return tuple(region)
+
+
+def region_size(region):
+    """Approximate (width, height) of `region` in meters."""
+    north, south, west, east = _bounds(region)
+    latitude = math.radians((north + south) / 2)
+    return ((east - west) * METERS_PER_DEGREE * math.cos(latitude),
+            (north - south) * METERS_PER_DEGREE)
+
+
+def geometric_meters_per_texel(path, tile_size=TILE_SIZE):
+    """Texel size of a `tile_size` texture spread over the box of `path`."""
+    north, south, west, east = octant_to_latlong(path)
+    latitude = math.radians((north + south) / 2)
+    width = (east - west) * METERS_PER_DEGREE * math.cos(latitude)
+    height = (north - south) * METERS_PER_DEGREE
+    return max(width, height) / tile_size
+
+
+def sampled_meters_per_texel(region, level=SAMPLE_LEVEL, concurrency=1):
+    """Median `NodeMetadata.meters_per_texel` of the octants at `level` over `region`.
+
+    See `sampled_meters_per_texel_many`.
+    """
+    return sampled_meters_per_texel_many([region], level, concurrency)[0]
+
+
+def sampled_meters_per_texel_many(regions, level=SAMPLE_LEVEL, concurrency=1):
+    """`sampled_meters_per_texel` of every region, from one shared walk.
+
+    Reads the bulk packets holding the octants at `level`, each once and
+    `concurrency` at a time; nodes without a value of their own take the
+    packet's default for their level. A region gets None when no octant at
+    `level` over it has one.
+    """
+    head_level = (level - 1) // 4 * 4
+    if head_level:
+        keys_per_region = [
+            [(octant.path, octant.epoch) for octant in overlaps[head_level]
+             if not octant.is_leaf and not octant.is_nodata]
+            for overlaps in find_overlaps_many(regions, target_level=head_level,
+                                               concurrency=concurrency)]
+    else:
+        keys_per_region = [[("", read_planetoid_metadata().root_node_metadata.epoch)]] * len(regions)
+    keys = sorted({key for region_keys in keys_per_region for key in region_keys})
+    executor = ThreadPoolExecutor(concurrency) if concurrency > 1 and len(keys) > 1 else None
+    try:
+        packets = dict(zip(keys, read_bulk_columns_many(keys, executor)))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    samples = []
+    for region, region_keys in zip(regions, keys_per_region):
+        values = [_meters_per_texel(packets[key], region, level - head_level) for key in region_keys]
+        values = np.concatenate(values) if values else np.empty(0)
+        samples.append(float(np.median(values)) if len(values) else None)
+    return samples
+
+
+def _meters_per_texel(columns, region, relative_level):
+    bulk = columns.bulk
+    intersects, _ = region_masks(columns, region)
+    rows = intersects & (columns.level == len(bulk.head_node_key.path) + relative_level)
+    meters_per_texel = node_column(bulk, "meters_per_texel")[rows]
+    defaults = bulk.meters_per_texel
+    if len(defaults) >= relative_level:
+        meters_per_texel = np.where(meters_per_texel > 0, meters_per_texel, defaults[relative_level - 1])
+    return meters_per_texel[meters_per_texel > 0]
+
+
+def choose_level(region, resolution=None, max_tiles=None, meters_per_texel=None,
+                 sample_level=SAMPLE_LEVEL, min_level=1, max_level=20, tile_size=TILE_SIZE):
+    """Pick the coarsest octant level whose mosaic of `region` is fine enough.
+
+    `resolution` is the wanted mosaic size in pixels along the longer side
+    of `region`; the first level reaching it is returned. `max_tiles` caps
+    the number of covering octants, so the level may stop short of
+    `resolution`; given alone, the deepest level within the cap is chosen.
+    Texel sizes come from `meters_per_texel` at `sample_level` (see
+    `sampled_meters_per_texel`), halving with every level below it, or else
+    from the size of the octant boxes. Tile counts come from `cover_region`
+    and leave out octants that differ only in altitude.
+    """
+    if resolution is None and max_tiles is None:
+        raise ValueError("either resolution or max_tiles is required")
+    size = max(region_size(region))
+    choice = None
+    for level in range(min_level, max_level + 1):
+        paths = cover_region(region, level)
+        if max_tiles is not None and len(paths) > max_tiles and choice is not None:
+            break
+        if meters_per_texel:
+            texel = meters_per_texel * 2.0 ** (sample_level - level)
+        else:
+            texel = geometric_meters_per_texel(paths[0], tile_size)
+        choice = LevelChoice(level, len(paths), size / texel, texel)
+        if max_tiles is not None and len(paths) > max_tiles:
+            break
+        if resolution is not None and choice.pixels >= resolution:
+            break
+    return choice
@@ -1,11 +1,16 @@
 #%%
 import os
-os.environ['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'] = 'python'
 
-from find_overlaps import find_overlaps, LatLonBox
-import requests
+import find_overlaps
+from find_overlaps import iter_overlaps_many, LatLonBox
+from imagery_index import ImageryIndex
+from download_planner import plan_octant
+from downloader import Downloader, TileKey
+from tile_store import TileStore
 from proto.rocktree_pb2 import NodeData, Texture
-from google.protobuf.internal import decoder
+from wire import iter_textures
+from mosaic import build_mosaic
+from level_selection import choose_level, sampled_meters_per_texel_many
 import geopandas as gpd
 from PIL import Image
 import numpy as np
@@ -18,127 +23,57 @@ from gpt_tools import analyze_construction_phase_openai, analyze_construction_ph
 import pandas as pd
 from shapely.geometry import shape
 
-def download_node_data(octant_path, version_map, year=2024):
-    """Download node data for a specific octant and extract textures."""
-    base_url = "https://kh.google.com/rt/tm/earth/NodeData/pb="
-    
+tile_store = TileStore()
+# Only the extracted JPEGs are stored, not the NodeData payloads they come from
+downloader = Downloader(concurrency=8)
+
+def tile_key(octant_path, version_map, year=2024):
     epoch, version, timestamp = version_map.get(year, (990, 350, 1036419))  # default to 2024
-    
-    # Format URL similar to the actual Google Earth request
-    url = base_url + "!1m2!1s{}!2u{}!2e1!3u{}!4b0!5i{}".format(
-        octant_path, epoch, version, timestamp
-    )
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-        'Referer': 'https://earth.google.com/'
-    }
-    
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return _extract_jpeg_from_protobuf(response.content)
-    return None
+    return TileKey(octant_path, epoch, version, timestamp)
+
+def _jpeg_from_result(result, imagery_index=None):
+    """Extract the JPEG of a downloaded tile.
+
+    Only a 404 is recorded as missing imagery in `imagery_index`: a payload
+    without a usable JPEG may be a parse problem or another texture format,
+    and is simply requested again next time.
+    """
+    if result.status == "failed":
+        print(f"Failed to download {result.key.path} after {result.attempts} attempts: {result.error}")
+        return None
+    jpeg_data = None
+    if result.status == "ok":
+        jpeg_data = _extract_jpeg_from_protobuf(result.data)
+        if jpeg_data is not None:
+            tile_store.put(result.key, jpeg_data, "jpeg")
+    if imagery_index is not None and (result.status == "missing" or jpeg_data is not None):
+        key = result.key
+        imagery_index.record(key.path, key.imagery_version, key.timestamp, jpeg_data is not None)
+    return jpeg_data
 
 def _extract_jpeg_from_protobuf(data):
-    """Extract JPEG image data from protobuf message"""
+    """Extract the first JPEG texture of a NodeData message"""
     try:
-        pos = 0
-        while pos < len(data):
-            tag, new_pos = decoder._DecodeVarint(data, pos)
-            wire_type = tag & 7
-            field_number = tag >> 3
-            
-            if wire_type == 2:  # Length-delimited
-                length, content_pos = decoder._DecodeVarint(data, new_pos)
-                content = data[content_pos:content_pos + length]
-                
-                if field_number == 2:
-                    # Parse nested message
-                    nested_pos = 0
-                    while nested_pos < len(content):
-                        nested_tag, nested_new_pos = decoder._DecodeVarint(content, nested_pos)
-                        nested_wire_type = nested_tag & 7
-                        nested_field_number = nested_tag >> 3
-                        
-                        if nested_wire_type == 2:
-                            nested_length, nested_content_pos = decoder._DecodeVarint(content, nested_new_pos)
-                            nested_content = content[nested_content_pos:nested_content_pos + nested_length]
-                            
-                            if nested_field_number == 6:
-                                jpeg_data = nested_content[3:]  # Skip the first 3 bytes
-                                if jpeg_data.startswith(b'\xFF\xD8'):
-                                    return jpeg_data
-                            
-                            nested_pos = nested_content_pos + nested_length
-                        else:
-                            nested_pos = nested_new_pos
-                
-                pos = content_pos + length
-            else:
-                pos = new_pos
-        
-        print("No valid JPEG data found in protobuf message")
-        return None
-    except Exception as e:
+        for texture in iter_textures(data):
+            if texture.format == Texture.JPG and texture.data is not None and texture.data[:2] == b'\xFF\xD8':
+                return bytes(texture.data)
+    except ValueError as e:
         print(f"Error extracting JPEG data: {e}")
-        import traceback
-        traceback.print_exc()
         return None
+    print("No valid JPEG data found in protobuf message")
+    return None
 
 
-def stitch_images(image_dict, octants):
+def stitch_images(image_dict, scale=1):
     """
-    Stitch images using their geographical positions from octant data
+    Stitch JPEG tiles {octant path: bytes} on the grid given by their octant paths
     """
     if not image_dict:
         return None, {"construction_phase": "no_data"}  # Return tuple with None and default analysis
     
-    # Create mapping of path to octant object
-    octant_map = {octant.path: octant for octant in octants}
-    
-    # Get dimensions of first image
-    first_image = next(iter(image_dict.values()))
-    tile_width, tile_height = first_image.size
-    
-    # Get geographical bounds
-    min_lon = min(octant_map[path].bbox.west for path in image_dict.keys())
-    max_lon = max(octant_map[path].bbox.east for path in image_dict.keys())
-    min_lat = min(octant_map[path].bbox.south for path in image_dict.keys())
-    max_lat = max(octant_map[path].bbox.north for path in image_dict.keys())
-    
-    # Find the size of a single tile in degrees
-    sample_octant = next(iter(octant_map.values()))
-    lon_step = sample_octant.bbox.east - sample_octant.bbox.west
-    lat_step = sample_octant.bbox.north - sample_octant.bbox.south
-    
-    def get_position(path):
-        octant = octant_map[path]
-        # Calculate position based on distance from minimum bounds
-        x = round((octant.bbox.west - min_lon) / lon_step)
-        y = round((max_lat - octant.bbox.north) / lat_step)  # Flip Y axis
-        print(f"\nTile {path}:")
-        print(f"  Bounds: N:{octant.bbox.north:.6f}, S:{octant.bbox.south:.6f}, "
-              f"E:{octant.bbox.east:.6f}, W:{octant.bbox.west:.6f}")
-        print(f"  Position: ({x}, {y})")
-        return x, y
-    
-    # Calculate grid size
-    positions = [get_position(path) for path in image_dict.keys()]
-    max_x = max(x for x, _ in positions) + 1
-    max_y = max(y for _, y in positions) + 1
-    
-    print(f"\nGrid size: {max_x}x{max_y}")
-    
-    # Create canvas
-    final_image = Image.new('RGB', (max_x * tile_width, max_y * tile_height))
-    
-    # Place images
-    for path, img in sorted(image_dict.items()):
-        x, y = get_position(path)
-        pixel_x = x * tile_width
-        pixel_y = y * tile_height
-        final_image.paste(img, (pixel_x, pixel_y))
-        print(f"Placed tile {path} at position ({x}, {y})")
+    mosaic = build_mosaic(image_dict, scale=scale)
+    final_image = Image.fromarray(mosaic.image)
+    print(f"\nGrid size: {mosaic.image.shape[1] // mosaic.tile_width}x{mosaic.image.shape[0] // mosaic.tile_height}")
     
     # Save final image to temporary file for analysis
     temp_filename = 'temp_combined.jpg'
@@ -188,56 +123,99 @@ gdf = gdf.iloc[300:600]
 # Create list to store results
 results = []
 
+# Create bboxes from the geojson features
+bboxes = []
+for bounds in gdf.geometry.bounds.itertuples(index=False):
+    bboxes.append(LatLonBox(
+        north=bounds.maxy,
+        south=bounds.miny,
+        west=bounds.minx,
+        east=bounds.maxx
+    ))
+
+# Remember which imagery exists where, across runs
+imagery_index = ImageryIndex()
+find_overlaps.imagery_index = imagery_index
+skipped_requests = 0
+avoided_requests = 0
+
+# Pick the coarsest level giving each footprint about TARGET_RESOLUTION pixels
+TARGET_RESOLUTION = 1024
+MAX_TILES = 64
+levels = []
+samples = sampled_meters_per_texel_many(list(gdf.geometry), concurrency=8)
+for geometry, meters_per_texel in zip(gdf.geometry, samples):
+    choice = choose_level(geometry, resolution=TARGET_RESOLUTION, max_tiles=MAX_TILES,
+                          meters_per_texel=meters_per_texel)
+    levels.append(choice.level)
+
+# Walk the tree once per level for all AOIs of that level, feeding every
+# tile to the downloader as soon as its octant is decoded, so downloads run
+# while the walk is still reading bulk metadata. Tiles shared by several
+# AOIs are downloaded once.
+images = [{year: {} for year in version_map.keys()} for _ in levels]
+tile_owners = {}
+downloaded = {}
+
+def add_tile(owners, path, jpeg_data):
+    for i, year in owners:
+        images[i][year][path] = jpeg_data
+
+def tiles_to_download(level, indices):
+    global avoided_requests, skipped_requests
+    geometries = [gdf.geometry.iloc[i] for i in indices]
+    for octant, matches in iter_overlaps_many(geometries, target_level=level, concurrency=8, leaves=True):
+        kind = plan_octant(octant, level)
+        if kind == "nodata":
+            # Leave out octants flagged NODATA before requesting anything
+            avoided_requests += len(version_map) * len(matches)
+            continue
+        if kind is None:
+            continue
+        for year in version_map.keys():
+            key = tile_key(octant.path, version_map, year)
+            owners = [(indices[m], year) for m in matches]
+            if key in tile_owners:
+                # The downloader works through a window of keys, so the
+                # tile may have arrived before these owners were found
+                tile_owners[key] += owners
+                if key in downloaded:
+                    add_tile(owners, key.path, downloaded[key])
+                continue
+            if not imagery_index.should_request(key.path, key.imagery_version, key.timestamp):
+                skipped_requests += 1
+                continue
+            jpeg_data = tile_store.get(key, "jpeg")
+            if jpeg_data is not None:
+                add_tile(owners, key.path, jpeg_data)
+                continue
+            tile_owners[key] = owners
+            yield key
+
+for level in sorted(set(levels)):
+    indices = [i for i, aoi_level in enumerate(levels) if aoi_level == level]
+    print(f"[Octant level {level}] {len(indices)} AOIs")
+    for result in downloader.download(tiles_to_download(level, indices)):
+        jpeg_data = _jpeg_from_result(result, imagery_index)
+        if jpeg_data:
+            downloaded[result.key] = jpeg_data
+            add_tile(tile_owners[result.key], result.key.path, jpeg_data)
+            print(f"Downloaded tile: {result.key.path}")
+imagery_index.flush()
+
 # Process each AOI
-for idx, aoi in gdf.iterrows():
+for (idx, aoi), bbox, aoi_images in zip(gdf.iterrows(), bboxes, images):
     print(f"\nProcessing AOI {idx + 1}/{len(gdf)}")
     
-    # Create bbox from the geojson feature
-    bounds = aoi.geometry.bounds
-    bbox = LatLonBox(
-        north=bounds[3],
-        south=bounds[1],
-        west=bounds[0],
-        east=bounds[2]
-    )
-    
     # Create maps URL from centroid
     centroid = aoi.geometry.centroid
     maps_url = f"https://maps.google.com/?q={centroid.y},{centroid.x}"
     
     print(f"Bounding box: {bbox}")
     
-    # Get overlapping octants
-    overlapping_octants = find_overlaps(bbox, 200)
-    
-    # Create dictionaries to store images by year
-    images = {year: {} for year in version_map.keys()}
-    octants_list = []
-    
-    level = 20
-    # Process the results and download data
-    if level in overlapping_octants:
-        print(f"[Octant level {level}]")
-        for octant in overlapping_octants[level]:
-            octants_list.append(octant)
-            print(octant.path)
-            
-            # Download for each year
-            for year in version_map.keys():
-                print(f"Downloading for year {year}")
-                jpeg_data = download_node_data(
-                    octant.path,
-                    version_map,
-                    year=year
-                )
-                       
-                if jpeg_data:
-                    images[year][octant.path] = Image.open(io.BytesIO(jpeg_data))
-                    print(f"Downloaded tile for {year}: {octant.path}")
-    
     # Stitch and save final images for this AOI
     for year in version_map.keys():
-        final_image, analysis = stitch_images(images[year], octants_list)
+        final_image, analysis = stitch_images(aoi_images[year])
         if final_image:
             filename = f'images/aoi_{idx+1}_{year}_{analysis["construction_phase"]}.jpg'
             final_image.save(filename)
@@ -259,6 +237,9 @@ for idx, aoi in gdf.iterrows():
     print(f"Updated results saved to construction_analysis.csv")
 
 # Final summary
+print(f"\nAvoided {avoided_requests} requests for NODATA octants")
+print(f"Skipped {skipped_requests} requests for imagery known to be missing")
+print(f"Tile store: {tile_store.stats()}")
 distressed_aois = df[df['construction_status'] == 'CONSTRUCTION'].groupby('aoi_number').filter(lambda x: len(x) > 1)['aoi_number'].unique()
 if len(distressed_aois) > 0:
     print(f"\nFound {len(distressed_aois)} potentially distressed AOIs: {distressed_aois}")
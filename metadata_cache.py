@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = os.environ.get("ROCKTREE_CACHE_DIR", ".rocktree_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class MetadataCache:
+    """On-disk LRU cache of raw rocktree metadata responses.
+
+    Entries are keyed by (planet, path, epoch). The file modification time
+    records when an entry was written and the access time is bumped on every
+    hit, so the LRU order survives between runs. Instances are safe to share
+    between threads.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._size = 0
+        self._reading = {}
+        self._lock = threading.Lock()
+
+    def _file(self, planet, path, epoch):
+        name = path or "root"
+        if epoch is not None:
+            name += f"@{epoch}"
+        return self.directory / planet / f"{name}.pb"
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        files = []
+        if self.directory.is_dir():
+            for file in self.directory.glob("*/*.pb"):
+                stat = file.stat()
+                files.append((stat.st_atime, file, stat.st_size))
+        self._entries = OrderedDict()
+        for _, file, size in sorted(files):
+            self._entries[file] = size
+            self._size += size
+
+    def get(self, planet, path, epoch, max_age=None):
+        file = self._file(planet, path, epoch)
+        with self._lock:
+            self._load()
+            cached = file in self._entries
+            if not cached:
+                self.misses += 1
+        if not cached:
+            return None
+        # Files are only ever replaced whole, so they can be read unlocked.
+        try:
+            if max_age is not None and time.time() - file.stat().st_mtime > max_age:
+                with self._lock:
+                    self._forget(file)
+                    self.misses += 1
+                self._unlink(file)
+                return None
+            data = file.read_bytes()
+            os.utime(file, (time.time(), file.stat().st_mtime))
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(file)
+                self.misses += 1
+            return None
+        with self._lock:
+            if file in self._entries:
+                self._entries.move_to_end(file)
+            self.hits += 1
+        return data
+
+    def fetch(self, planet, path, epoch, read, max_age=None):
+        """Cached data, or else the result of `read()`, which is then cached.
+
+        Concurrent misses on the same entry call `read` only once; the other
+        callers wait for it and take the cached copy.
+        """
+        file = self._file(planet, path, epoch)
+        while True:
+            data = self.get(planet, path, epoch, max_age=max_age)
+            if data is not None:
+                return data
+            with self._lock:
+                reading = self._reading.get(file)
+                if reading is None:
+                    reading = self._reading[file] = threading.Event()
+                    break
+            reading.wait()
+        try:
+            data = read()
+            self.put(planet, path, epoch, data)
+            return data
+        finally:
+            with self._lock:
+                del self._reading[file]
+            reading.set()
+
+    def put(self, planet, path, epoch, data):
+        file = self._file(planet, path, epoch)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, file)
+        with self._lock:
+            self._load()
+            self._forget(file)
+            self._entries[file] = len(data)
+            self._size += len(data)
+            evicted = self._evict()
+        for file in evicted:
+            self._unlink(file)
+
+    def clear(self):
+        with self._lock:
+            self._load()
+            files = list(self._entries)
+            for file in files:
+                self._forget(file)
+        for file in files:
+            self._unlink(file)
+
+    def stats(self):
+        with self._lock:
+            self._load()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _evict(self):
+        evicted = []
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            file = next(iter(self._entries))
+            self._forget(file)
+            evicted.append(file)
+        return evicted
+
+    def _unlink(self, file):
+        try:
+            file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, file):
+        size = self._entries.pop(file, None)
+        if size is not None:
+            self._size -= size
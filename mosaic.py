@@ -0,0 +1,85 @@
+import io
+from collections import namedtuple
+
+import numpy as np
+
+from octant_keys import pack_paths
+from octant_keys import path_digit
+
+DRAFT_SCALES = (1, 2, 4, 8)
+
+# `image` is an (rows * tile_height, cols * tile_width, 3) uint8 array whose
+# top left cell sits at grid position (row, col) of the finest octants placed,
+# which are at `level`.
+Mosaic = namedtuple("Mosaic", ["image", "level", "row", "col", "tile_width", "tile_height"])
+
+
+def grid_positions(paths):
+    """Integer grid cells (rows, cols, heights, widths) covered by octants.
+
+    The bits come straight from the path: level 1 splits both ways, level 2
+    only east-west, and every further level both ways again, except that
+    boxes touching a pole are not split east-west. Cells are those of the
+    smallest octants given; larger ones, from a coarser level or next to a
+    pole, span 2^k cells each way. Rows count from the north.
+    """
+    keys = pack_paths(paths)
+    levels = (keys & np.uint64(31)).astype(np.int64)
+    digit = path_digit(keys, 0)
+    row, col = digit >> 1, digit & 1
+    north_pole, south_pole = row == 1, row == 0
+    col = np.where(levels > 1, col << 1 | path_digit(keys, 1) & 1, col)
+    col_bits = np.where(levels > 1, 2, 1)
+    for i in range(2, int(levels.max())):
+        inside = levels > i
+        digit = path_digit(keys, i)
+        y = digit >> 1 & 1
+        north_pole &= y == 1
+        south_pole &= y == 0
+        split = inside & ~(north_pole | south_pole)
+        row = np.where(inside, row << 1 | y, row)
+        col = np.where(split, col << 1 | digit & 1, col)
+        col_bits += split
+    row_bits = np.maximum(levels - 1, 1)
+    row_shift, col_shift = row_bits.max() - row_bits, col_bits.max() - col_bits
+    heights, widths = 1 << row_shift, 1 << col_shift
+    rows = (1 << int(row_bits.max())) - (row << row_shift) - heights
+    return rows, col << col_shift, heights, widths
+
+
+def build_mosaic(tiles, scale=1):
+    """Place JPEG tiles {path: bytes} on a single uint8 canvas.
+
+    Tiles larger than the finest ones are resized over the cells they
+    cover. With `scale` 2, 4 or 8 tiles are decoded at that fraction of
+    their size using the JPEG decoder's draft mode, which is much cheaper
+    than decoding in full and resizing. Cells without a tile stay black.
+    """
+    from PIL import Image
+
+    if scale not in DRAFT_SCALES:
+        raise ValueError(f"scale must be one of {DRAFT_SCALES}, got {scale}")
+    if not tiles:
+        raise ValueError("no tiles to place")
+    paths = list(tiles)
+    level = max(len(path) for path in paths)
+    rows, cols, heights, widths = grid_positions(paths)
+    row0, col0 = int(rows.min()), int(cols.min())
+
+    first = Image.open(io.BytesIO(tiles[paths[0]]))
+    width, height = first.size[0] // scale, first.size[1] // scale
+    canvas = np.zeros(((int((rows + heights).max()) - row0) * height,
+                       (int((cols + widths).max()) - col0) * width, 3), dtype=np.uint8)
+    for path, row, col, rows_spanned, cols_spanned in zip(
+            paths, rows.tolist(), cols.tolist(), heights.tolist(), widths.tolist()):
+        size = (cols_spanned * width, rows_spanned * height)
+        image = Image.open(io.BytesIO(tiles[path]))
+        if scale > 1:
+            image.draft("RGB", size)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        if image.size != size:
+            image = image.resize(size)
+        top, left = (row - row0) * height, (col - col0) * width
+        canvas[top:top + size[1], left:left + size[0]] = np.asarray(image)
+    return Mosaic(canvas, level, row0, col0, width, height)
@@ -0,0 +1,96 @@
+from collections import defaultdict
+
+import numpy as np
+
+from bulk_columns import BulkColumns
+from find_overlaps import Octant
+from find_overlaps import is_geometry
+from find_overlaps import region_masks
+from octant_keys import key_level
+
+_FIELDS = ("path", "level", "flags", "epoch", "north", "south", "west", "east")
+
+
+class OctantIndex:
+    """In-memory spatial index of known octants, one sorted table per level.
+
+    Each level is a `BulkColumns` table sorted by west edge. Octants at one
+    level have (almost) the same width, so a query only scans the rows whose
+    west edge lies within one tile width of the query box. Additions are
+    buffered and merged into the tables on the next query.
+    """
+
+    def __init__(self):
+        self._tables = {}
+        self._widths = {}
+        self._pending = defaultdict(list)
+
+    @classmethod
+    def from_overlaps(cls, *overlaps):
+        """Build an index from `find_overlaps` results."""
+        index = cls()
+        for result in overlaps:
+            for octants in result.values():
+                index.add(octants)
+        return index
+
+    def add(self, octants):
+        """Add octants, e.g. straight from `iter_overlaps`."""
+        rows = defaultdict(list)
+        for octant in octants:
+            rows[key_level(octant.key)].append(
+                (octant.key, octant.flags, octant.epoch,
+                 octant.north, octant.south, octant.west, octant.east))
+        for level, level_rows in rows.items():
+            key, flags, epoch, n, s, w, e = (np.array(column) for column in zip(*level_rows))
+            self._pending[level].append(BulkColumns(
+                None, key.astype(np.uint64), np.full(len(key), level, dtype=np.uint8),
+                flags.astype(np.uint32), epoch.astype(np.uint32),
+                n.astype(np.float64), s.astype(np.float64),
+                w.astype(np.float64), e.astype(np.float64)))
+
+    def add_columns(self, columns):
+        """Add every row of a decoded bulk packet."""
+        for level in np.unique(columns.level):
+            rows = columns.level == level
+            self._pending[int(level)].append(BulkColumns(
+                None, *(getattr(columns, field)[rows] for field in _FIELDS)))
+
+    def __len__(self):
+        self._merge()
+        return sum(len(table) for table in self._tables.values())
+
+    def levels(self):
+        self._merge()
+        return sorted(self._tables)
+
+    def _merge(self):
+        for level, parts in self._pending.items():
+            if level in self._tables:
+                parts = [self._tables[level]] + parts
+            merged = [np.concatenate([getattr(part, field) for part in parts])
+                      for field in _FIELDS]
+            # Keep the latest row for every key, then order by west edge.
+            _, last = np.unique(merged[0][::-1], return_index=True)
+            rows = len(merged[0]) - 1 - last
+            rows = rows[np.argsort(merged[6][rows], kind="stable")]
+            table = BulkColumns(None, *(column[rows] for column in merged))
+            self._tables[level] = table
+            self._widths[level] = float((table.east - table.west).max())
+        self._pending.clear()
+
+    def query(self, region, level, min_overlap=0.0):
+        """Octants at `level` touching `region`, a `LatLonBox` or shapely geometry."""
+        self._merge()
+        table = self._tables.get(level)
+        if table is None:
+            return []
+        if is_geometry(region):
+            west, south, east, north = region.bounds
+        else:
+            north, south, west, east = region
+        start = np.searchsorted(table.west, west - self._widths[level], side="left")
+        stop = np.searchsorted(table.west, east, side="right")
+        candidates = BulkColumns(None, *(getattr(table, field)[start:stop] for field in _FIELDS))
+        _, mask = region_masks(candidates, region, min_overlap)
+        return [Octant.from_columns(candidates, i) for i in np.flatnonzero(mask)]
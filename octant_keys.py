@@ -0,0 +1,102 @@
+import numpy as np
+
+# Octant paths are packed left-aligned into 64-bit keys so that sorting keys
+# sorts paths depth first and every subtree is one contiguous key range: the
+# top-level digit (0-3) takes bits 62-63, every further digit the next 3 bits
+# below it, and the level the lowest 5 bits.
+MAX_LEVEL = 20
+LEVEL_BITS = 5
+LEVEL_MASK = (1 << LEVEL_BITS) - 1
+DIGIT_SHIFTS = [62] + [62 - 3 * i for i in range(1, MAX_LEVEL)]
+DIGIT_MASKS = [3] + [7] * (MAX_LEVEL - 1)
+# Below level 2 the high bit of a digit picks the upper or lower octant at the
+# same latitude and longitude.
+ALTITUDE_BITS = sum(4 << shift for shift in DIGIT_SHIFTS[2:])
+
+
+def pack_path(path):
+    if len(path) > MAX_LEVEL:
+        raise ValueError(f"octant path longer than {MAX_LEVEL} levels: {path}")
+    key = len(path)
+    for shift, mask, digit in zip(DIGIT_SHIFTS, DIGIT_MASKS, path):
+        digit = int(digit)
+        if digit > mask:
+            raise ValueError(f"invalid octant path: {path}")
+        key |= digit << shift
+    return key
+
+
+def unpack_path(key):
+    level = key & LEVEL_MASK
+    return "".join(str((key >> shift) & mask)
+                   for shift, mask in zip(DIGIT_SHIFTS[:level], DIGIT_MASKS))
+
+
+def key_level(key):
+    return key & LEVEL_MASK
+
+
+def prefix_mask(level):
+    """Mask selecting the first `level` digits of a key."""
+    if level == 0:
+        return 0
+    return (1 << 64) - (1 << DIGIT_SHIFTS[level - 1])
+
+
+def parent_key(key):
+    level = key_level(key)
+    if level == 0:
+        raise ValueError("the root octant has no parent")
+    return key & prefix_mask(level - 1) | (level - 1)
+
+
+def descendant_range(key):
+    """Half-open range of keys holding `key` and all octants below it."""
+    level = key_level(key)
+    start = key & prefix_mask(level)
+    return start, start + (1 << 64) - prefix_mask(level)
+
+
+def planar_key(key):
+    """Key of the lower octant with the same box as `key`."""
+    return key & ~ALTITUDE_BITS
+
+
+def planar_path(path):
+    return path[:2] + "".join(str(int(digit) & 3) for digit in path[2:])
+
+
+def pack_paths(paths):
+    """Vectorized `pack_path` over a sequence of path strings."""
+    paths = np.asarray(paths)
+    if len(paths):
+        lengths = np.char.str_len(paths)
+        if lengths.max() > MAX_LEVEL:
+            raise ValueError(f"octant path longer than {MAX_LEVEL} levels: {paths[lengths.argmax()]}")
+    paths = paths.astype(f"S{MAX_LEVEL}")
+    digits = paths.view(np.uint8).reshape(len(paths), MAX_LEVEL).astype(np.uint64)
+    level = (digits != 0).sum(axis=1).astype(np.uint64)
+    keys = level.copy()
+    for i, shift in enumerate(DIGIT_SHIFTS):
+        digit = np.where(digits[:, i] != 0, digits[:, i] - np.uint64(ord("0")), np.uint64(0))
+        if (digit > DIGIT_MASKS[i]).any():
+            raise ValueError(f"invalid octant path at digit {i}")
+        keys |= digit << np.uint64(shift)
+    return keys
+
+
+def unpack_paths(keys):
+    """Vectorized `unpack_path`, returns an array of path strings."""
+    keys = np.asarray(keys, dtype=np.uint64)
+    level = (keys & np.uint64(LEVEL_MASK)).astype(np.int64)
+    digits = np.zeros((len(keys), MAX_LEVEL), dtype=np.uint8)
+    for i, shift in enumerate(DIGIT_SHIFTS):
+        digit = (keys >> np.uint64(shift)) & np.uint64(DIGIT_MASKS[i])
+        digits[:, i] = np.where(level > i, digit + ord("0"), 0)
+    return digits.view(f"S{MAX_LEVEL}").ravel().astype(str)
+
+
+def path_digit(keys, i):
+    """Digit `i` (0-based) of every key in `keys`."""
+    mask = np.uint64(DIGIT_MASKS[i])
+    return ((keys >> np.uint64(DIGIT_SHIFTS[i])) & mask).astype(np.int64)
@@ -1,5 +1,18 @@
+import sys
+from collections import OrderedDict
 from collections import namedtuple
 
+import numpy as np
+
+from octant_keys import DIGIT_SHIFTS
+from octant_keys import LEVEL_MASK
+from octant_keys import MAX_LEVEL
+from octant_keys import pack_path
+from octant_keys import pack_paths
+from octant_keys import path_digit
+from octant_keys import prefix_mask
+from octant_keys import unpack_paths
+
 octant_dict = {
     '0': (0, 0, 0),
     '1': (1, 0, 0),
@@ -80,8 +93,242 @@ first_latlonbox_dict = {
 }
 
 
-def octant_to_latlong(octant_string):
+def octant_to_latlong(octant_string, cache=None):
+    if cache is not None:
+        return cache.lookup(octant_string)
     latlonbox = first_latlonbox_dict[octant_string[0:2]]
     for octant in octant_string[2:]:
         latlonbox = latlonbox.get_child(octant)
     return latlonbox
+
+
+_first_boxes = sorted((pack_path(path), box) for path, box in first_latlonbox_dict.items())
+_first_keys = np.array([key for key, _ in _first_boxes], dtype=np.uint64)
+_first_nswe = np.array([box for _, box in _first_boxes], dtype=np.float64)
+
+
+def get_child_batch(n, s, w, e, digits, active):
+    """Apply `LatLonBox.get_child` in place to the rows where `active` is set."""
+    y = (digits >> 1) & 1
+    x = digits & 1
+    mid_lat = (n + s) / 2
+    mid_lon = (w + e) / 2
+    n[:] = np.where(active & (y == 0), mid_lat, n)
+    s[:] = np.where(active & (y == 1), mid_lat, s)
+    split_lon = active & (n != 90) & (s != -90)
+    e[:] = np.where(split_lon & (x == 0), mid_lon, e)
+    w[:] = np.where(split_lon & (x == 1), mid_lon, w)
+
+
+def octant_to_latlong_batch(paths, prefix=""):
+    """Vectorized `octant_to_latlong`, returns north, south, west and east arrays.
+
+    `paths` holds packed keys (see `octant_keys`) or path strings. If every
+    path is known to start with `prefix`, its box is only computed once.
+    """
+    paths = np.asarray(paths)
+    if paths.dtype.kind in "SU":
+        keys = pack_paths(paths)
+    else:
+        keys = paths.astype(np.uint64)
+    count = len(keys)
+    level = (keys & np.uint64(LEVEL_MASK)).astype(np.int64)
+
+    if len(prefix) >= 2:
+        n, s, w, e = (np.full(count, value, dtype=np.float64)
+                      for value in octant_to_latlong(prefix))
+        first_subdivided = len(prefix)
+    else:
+        # The first two levels don't follow `get_child`, look them up instead.
+        first_level = np.minimum(level, 2).astype(np.uint64)
+        first_bits = np.where(first_level == 1, np.uint64(prefix_mask(1)), np.uint64(prefix_mask(2)))
+        first_keys = (keys & first_bits) | first_level
+        index = np.minimum(np.searchsorted(_first_keys, first_keys), len(_first_keys) - 1)
+        if (_first_keys[index] != first_keys).any():
+            raise ValueError("invalid octant value")
+        n, s, w, e = _first_nswe[index].T.copy()
+        first_subdivided = 2
+
+    max_level = int(level.max()) if count else 0
+    for i in range(first_subdivided, max_level):
+        get_child_batch(n, s, w, e, path_digit(keys, i), level > i)
+    return n, s, w, e
+
+
+def _boxes_intersect(n, s, w, e, region):
+    if not hasattr(region, "geom_type"):
+        rn, rs, rw, re = region
+        return (np.minimum(n, rn) >= np.maximum(s, rs)) & (np.maximum(w, rw) <= np.minimum(e, re))
+    import shapely
+
+    rw, rs, re, rn = region.bounds
+    intersects = (np.minimum(n, rn) >= np.maximum(s, rs)) & (np.maximum(w, rw) <= np.minimum(e, re))
+    candidates = np.flatnonzero(intersects)
+    if len(candidates):
+        shapely.prepare(region)
+        boxes = shapely.box(w[candidates], s[candidates], e[candidates], n[candidates])
+        intersects[candidates] = shapely.intersects(boxes, region)
+    return intersects
+
+
+def cover_region(region, level, packed=False):
+    """Octant paths at `level` whose boxes intersect `region`, from geometry alone.
+
+    `region` is a `LatLonBox` or a shapely geometry in lon/lat. Octants
+    below level 2 come in pairs that share a box and differ only in the
+    altitude bit of a digit (see `octant_keys.planar_key`); geometry can't
+    tell them apart, so only the lower one of each pair is returned.
+    """
+    if not 1 <= level <= MAX_LEVEL:
+        raise ValueError(f"level must be between 1 and {MAX_LEVEL}, got {level}")
+    first = [path for path in first_latlonbox_dict if len(path) == min(level, 2)]
+    keys = pack_paths(first)
+    n, s, w, e = (np.array(column, dtype=np.float64)
+                  for column in zip(*(first_latlonbox_dict[p] for p in first)))
+    keep = _boxes_intersect(n, s, w, e, region)
+    keys, n, s, w, e = keys[keep], n[keep], s[keep], w[keep], e[keep]
+
+    for i in range(2, level):
+        digits = np.tile(np.arange(4), len(keys))
+        keys, n, s, w, e = (np.repeat(column, 4) for column in (keys, n, s, w, e))
+        keys = (keys + np.uint64(1)) | (digits.astype(np.uint64) << np.uint64(DIGIT_SHIFTS[i]))
+        get_child_batch(n, s, w, e, digits, True)
+        keep = _boxes_intersect(n, s, w, e, region)
+        keys, n, s, w, e = keys[keep], n[keep], s[keep], w[keep], e[keep]
+
+    keys = np.sort(keys)
+    return keys if packed else unpack_paths(keys).tolist()
+
+
+def latlon_to_octant(lats, lons, level, packed=False):
+    """Paths of the octants at `level` that contain each point.
+
+    The inverse of `octant_to_latlong` for arrays of coordinates: the box of
+    every returned path contains its point. Points on a shared edge go to
+    the northern or eastern box. Like `cover_region` this returns the lower
+    octant of each same-box pair, and longitude digits are 0 inside boxes
+    that touch a pole, as those are not split by longitude.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if not 1 <= level <= MAX_LEVEL:
+        raise ValueError(f"level must be between 1 and {MAX_LEVEL}, got {level}")
+    if (np.abs(lats) > 90).any() or (np.abs(lons) > 180).any():
+        raise ValueError("coordinates out of range")
+
+    north = lats >= 0
+    keys = ((north * 2 + (lons >= 0)).astype(np.uint64) << np.uint64(DIGIT_SHIFTS[0])) | np.uint64(1)
+    if level >= 2:
+        w, e = np.where(lons >= 0, 0.0, -180.0), np.where(lons >= 0, 180.0, 0.0)
+        east = lons >= (w + e) / 2
+        digit = np.where(north, 0, 2) + east
+        keys = (keys + np.uint64(1)) | (digit.astype(np.uint64) << np.uint64(DIGIT_SHIFTS[1]))
+    n, s, w, e = _first_nswe[np.searchsorted(_first_keys, keys)].T.copy()
+
+    for i in range(2, level):
+        y = lats >= (n + s) / 2
+        mid_lon = (w + e) / 2
+        pole = np.where(y, n, (n + s) / 2) == 90
+        pole |= np.where(y, (n + s) / 2, s) == -90
+        x = ~pole & (lons >= mid_lon)
+        digits = y * 2 + x
+        get_child_batch(n, s, w, e, digits, True)
+        keys = (keys + np.uint64(1)) | (digits.astype(np.uint64) << np.uint64(DIGIT_SHIFTS[i]))
+
+    return keys if packed else unpack_paths(keys)
+
+
+class LatLonBoxTrie:
+    """Bounded cache of octant boxes, organised as a prefix trie.
+
+    A lookup reuses the box of the longest cached prefix and only subdivides
+    the remaining digits, so a path whose parent is cached costs one
+    `get_child` call. Only childless nodes are evicted, least recently used
+    first, which keeps every cached node reachable from the root. `stats`
+    counts a lookup as a hit only when its whole path was cached.
+    """
+
+    def __init__(self, max_entries=100_000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # A node is [box, children, parent, digit, path].
+        self._root = [first_latlonbox_dict[""], {}, None, "", ""]
+        self._leaves = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def lookup(self, path):
+        node = self._root
+        depth = 0
+        for digit in path:
+            child = node[1].get(digit)
+            if child is None:
+                break
+            node = child
+            depth += 1
+
+        if depth == len(path):
+            self.hits += 1
+            if path in self._leaves:
+                self._leaves.move_to_end(path)
+            return node[0]
+
+        # Subdivide first, so an invalid digit leaves the trie untouched
+        box = node[0]
+        boxes = []
+        for i in range(depth, len(path)):
+            if i < 2:
+                box = first_latlonbox_dict.get(path[:i + 1])
+                if box is None:
+                    raise ValueError("invalid octant value")
+            else:
+                box = box.get_child(path[i])
+            boxes.append(box)
+
+        self.misses += 1
+        if node is not self._root and not node[1]:
+            del self._leaves[node[4]]
+        for i, box in enumerate(boxes, depth):
+            child = [box, {}, node, path[i], path[:i + 1]]
+            node[1][path[i]] = child
+            node = child
+        self._size += len(boxes)
+        self._leaves[path] = node
+        self._evict()
+        return box
+
+    def _evict(self):
+        while self._size > self.max_entries:
+            _, node = self._leaves.popitem(last=False)
+            parent = node[2]
+            del parent[1][node[3]]
+            self._size -= 1
+            if parent is not self._root and not parent[1]:
+                self._leaves[parent[4]] = parent
+                self._leaves.move_to_end(parent[4], last=False)
+
+    def clear(self):
+        self._root[1].clear()
+        self._leaves.clear()
+        self._size = 0
+
+    def memory_bytes(self):
+        """Rough size of the cached nodes, excluding the shared first boxes."""
+        box = LatLonBox(0.5, 0.25, 0.125, 0.0625)
+        node = (sys.getsizeof([None] * 5) + sys.getsizeof({})
+                + sys.getsizeof(box) + sum(sys.getsizeof(x) for x in box)
+                + sys.getsizeof("0" * 11))
+        return self._size * node
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self._size,
+            "memory_bytes": self.memory_bytes(),
+        }
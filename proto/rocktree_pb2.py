@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: rocktree.proto
-
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -13,1148 +13,61 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='rocktree.proto',
-  package='geo_globetrotter_proto_rocktree',
-  syntax='proto2',
-  serialized_options=None,
-  serialized_pb=b'\n\x0erocktree.proto\x12\x1fgeo_globetrotter_proto_rocktree\"Q\n\x13\x42ulkMetadataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\"\xad\x01\n\x0fNodeDataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\x12G\n\x0etexture_format\x18\x02 \x01(\x0e\x32/.geo_globetrotter_proto_rocktree.Texture.Format\x12\x15\n\rimagery_epoch\x18\x03 \x01(\r\"&\n\x07NodeKey\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\r\n\x05\x65poch\x18\x02 \x01(\r\"!\n\x10\x43opyrightRequest\x12\r\n\x05\x65poch\x18\x01 \x01(\r\"\xe9\x01\n\x12TextureDataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\x12G\n\x0etexture_format\x18\x02 \x01(\x0e\x32/.geo_globetrotter_proto_rocktree.Texture.Format\x12N\n\x0eview_direction\x18\x03 \x01(\x0e\x32\x36.geo_globetrotter_proto_rocktree.Texture.ViewDirection\"\x88\x03\n\x0c\x42ulkMetadata\x12\x44\n\rnode_metadata\x18\x01 \x03(\x0b\x32-.geo_globetrotter_proto_rocktree.NodeMetadata\x12?\n\rhead_node_key\x18\x02 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\x12\x1c\n\x10head_node_center\x18\x03 \x03(\x01\x42\x02\x10\x01\x12\x1c\n\x10meters_per_texel\x18\x04 \x03(\x02\x42\x02\x10\x01\x12\x1d\n\x15\x64\x65\x66\x61ult_imagery_epoch\x18\x05 \x01(\r\x12)\n!default_available_texture_formats\x18\x06 \x01(\r\x12\x31\n)default_available_view_dependent_textures\x18\x07 \x01(\r\x12\x38\n0default_available_view_dependent_texture_formats\x18\x08 \x01(\r\"\xaa\x03\n\x0cNodeMetadata\x12\x16\n\x0epath_and_flags\x18\x01 \x01(\r\x12\r\n\x05\x65poch\x18\x02 \x01(\r\x12\x1b\n\x13\x62ulk_metadata_epoch\x18\x05 \x01(\r\x12\x1d\n\x15oriented_bounding_box\x18\x03 \x01(\x0c\x12\x18\n\x10meters_per_texel\x18\x04 \x01(\x02\x12,\n processing_oriented_bounding_box\x18\x06 \x03(\x01\x42\x02\x10\x01\x12\x15\n\rimagery_epoch\x18\x07 \x01(\r\x12!\n\x19\x61vailable_texture_formats\x18\x08 \x01(\r\x12)\n!available_view_dependent_textures\x18\t \x01(\r\x12\x30\n(available_view_dependent_texture_formats\x18\n \x01(\r\"X\n\x05\x46lags\x12\x0f\n\x0bRICH3D_LEAF\x10\x01\x12\x11\n\rRICH3D_NODATA\x10\x02\x12\x08\n\x04LEAF\x10\x04\x12\n\n\x06NODATA\x10\x08\x12\x15\n\x11USE_IMAGERY_EPOCH\x10\x10\"\xed\x02\n\x08NodeData\x12\"\n\x16matrix_globe_from_mesh\x18\x01 \x03(\x01\x42\x02\x10\x01\x12\x35\n\x06meshes\x18\x02 \x03(\x0b\x32%.geo_globetrotter_proto_rocktree.Mesh\x12\x15\n\rcopyright_ids\x18\x03 \x03(\r\x12:\n\x08node_key\x18\x04 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\x12\x1c\n\x10kml_bounding_box\x18\x05 \x03(\x01\x42\x02\x10\x01\x12\x39\n\nwater_mesh\x18\x06 \x01(\x0b\x32%.geo_globetrotter_proto_rocktree.Mesh\x12\x45\n\x16overlay_surface_meshes\x18\x07 \x03(\x0b\x32%.geo_globetrotter_proto_rocktree.Mesh\x12\x13\n\x0b\x66or_normals\x18\x08 \x01(\x0c\"\xa1\x05\n\x04Mesh\x12\x10\n\x08vertices\x18\x01 \x01(\x0c\x12\x15\n\rvertex_alphas\x18\t \x01(\x0c\x12\x16\n\x0etexture_coords\x18\x02 \x01(\x0c\x12\x0f\n\x07indices\x18\x03 \x01(\x0c\x12\x15\n\roctant_ranges\x18\x04 \x01(\x0c\x12\x14\n\x0clayer_counts\x18\x05 \x01(\x0c\x12\x39\n\x07texture\x18\x06 \x03(\x0b\x32(.geo_globetrotter_proto_rocktree.Texture\x12\x1b\n\x13texture_coordinates\x18\x07 \x01(\x0c\x12\x1f\n\x13uv_offset_and_scale\x18\n \x03(\x02\x42\x02\x10\x01\x12\x1f\n\x17layer_and_octant_counts\x18\x08 \x01(\x0c\x12\x0f\n\x07normals\x18\x0b \x01(\x0c\x12\x13\n\x0bnormals_dev\x18\x10 \x01(\x0c\x12\x0f\n\x07mesh_id\x18\x0c \x01(\r\x12\x13\n\x0bskirt_flags\x18\r \x01(\x0c\"\xd6\x01\n\x05Layer\x12\x0e\n\nOVERGROUND\x10\x00\x12\x17\n\x13TERRAIN_BELOW_WATER\x10\x01\x12\x17\n\x13TERRAIN_ABOVE_WATER\x10\x02\x12\x12\n\x0eTERRAIN_HIDDEN\x10\x03\x12\t\n\x05WATER\x10\x04\x12\x10\n\x0cWATER_SKIRTS\x10\x05\x12\x19\n\x15WATER_SKIRTS_INVERTED\x10\x06\x12\x13\n\x0fOVERLAY_SURFACE\x10\x07\x12\x1a\n\x16OVERLAY_SURFACE_SKIRTS\x10\x08\x12\x0e\n\nNUM_LAYERS\x10\t\"[\n\tLayerMask\x12\x1b\n\x17TERRAIN_WITH_OVERGROUND\x10\x07\x12\x16\n\x12TERRAIN_WITH_WATER\x10\x1c\x12\x19\n\x15TERRAIN_WITHOUT_WATER\x10\x0e\"\x81\x03\n\x07Texture\x12\x0c\n\x04\x64\x61ta\x18\x01 \x03(\x0c\x12?\n\x06\x66ormat\x18\x02 \x01(\x0e\x32/.geo_globetrotter_proto_rocktree.Texture.Format\x12\x12\n\x05width\x18\x03 \x01(\r:\x03\x32\x35\x36\x12\x13\n\x06height\x18\x04 \x01(\r:\x03\x32\x35\x36\x12N\n\x0eview_direction\x18\x05 \x01(\x0e\x32\x36.geo_globetrotter_proto_rocktree.Texture.ViewDirection\x12\x0f\n\x07mesh_id\x18\x06 \x01(\r\"K\n\x06\x46ormat\x12\x07\n\x03JPG\x10\x01\x12\x08\n\x04\x44XT1\x10\x02\x12\x08\n\x04\x45TC1\x10\x03\x12\n\n\x06PVRTC2\x10\x04\x12\n\n\x06PVRTC4\x10\x05\x12\x0c\n\x08\x43RN_DXT1\x10\x06\"P\n\rViewDirection\x12\t\n\x05NADIR\x10\x00\x12\x0c\n\x08NORTH_45\x10\x01\x12\x0b\n\x07\x45\x41ST_45\x10\x02\x12\x0c\n\x08SOUTH_45\x10\x03\x12\x0b\n\x07WEST_45\x10\x04\"\x85\x01\n\x0bTextureData\x12:\n\x08node_key\x18\x01 \x01(\x0b\x32(.geo_globetrotter_proto_rocktree.NodeKey\x12:\n\x08textures\x18\x02 \x03(\x0b\x32(.geo_globetrotter_proto_rocktree.Texture\"L\n\nCopyrights\x12>\n\ncopyrights\x18\x01 \x03(\x0b\x32*.geo_globetrotter_proto_rocktree.Copyright\"9\n\tCopyright\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x12\n\ntext_clean\x18\x03 \x01(\t\"\xaa\x01\n\x11PlanetoidMetadata\x12I\n\x12root_node_metadata\x18\x01 \x01(\x0b\x32-.geo_globetrotter_proto_rocktree.NodeMetadata\x12\x0e\n\x06radius\x18\x02 \x01(\x02\x12\x1c\n\x14min_terrain_altitude\x18\x03 \x01(\x02\x12\x1c\n\x14max_terrain_altitude\x18\x04 \x01(\x02'
-)
-
-
-
-_NODEMETADATA_FLAGS = _descriptor.EnumDescriptor(
-  name='Flags',
-  full_name='geo_globetrotter_proto_rocktree.NodeMetadata.Flags',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='RICH3D_LEAF', index=0, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RICH3D_NODATA', index=1, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LEAF', index=2, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NODATA', index=3, number=8,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='USE_IMAGERY_EPOCH', index=4, number=16,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1355,
-  serialized_end=1443,
-)
-_sym_db.RegisterEnumDescriptor(_NODEMETADATA_FLAGS)
-
-_MESH_LAYER = _descriptor.EnumDescriptor(
-  name='Layer',
-  full_name='geo_globetrotter_proto_rocktree.Mesh.Layer',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='OVERGROUND', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_BELOW_WATER', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_ABOVE_WATER', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_HIDDEN', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WATER', index=4, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WATER_SKIRTS', index=5, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WATER_SKIRTS_INVERTED', index=6, number=6,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OVERLAY_SURFACE', index=7, number=7,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OVERLAY_SURFACE_SKIRTS', index=8, number=8,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NUM_LAYERS', index=9, number=9,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2180,
-  serialized_end=2394,
-)
-_sym_db.RegisterEnumDescriptor(_MESH_LAYER)
-
-_MESH_LAYERMASK = _descriptor.EnumDescriptor(
-  name='LayerMask',
-  full_name='geo_globetrotter_proto_rocktree.Mesh.LayerMask',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_WITH_OVERGROUND', index=0, number=7,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_WITH_WATER', index=1, number=28,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TERRAIN_WITHOUT_WATER', index=2, number=14,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2396,
-  serialized_end=2487,
-)
-_sym_db.RegisterEnumDescriptor(_MESH_LAYERMASK)
-
-_TEXTURE_FORMAT = _descriptor.EnumDescriptor(
-  name='Format',
-  full_name='geo_globetrotter_proto_rocktree.Texture.Format',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='JPG', index=0, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DXT1', index=1, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ETC1', index=2, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PVRTC2', index=3, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PVRTC4', index=4, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CRN_DXT1', index=5, number=6,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2718,
-  serialized_end=2793,
-)
-_sym_db.RegisterEnumDescriptor(_TEXTURE_FORMAT)
-
-_TEXTURE_VIEWDIRECTION = _descriptor.EnumDescriptor(
-  name='ViewDirection',
-  full_name='geo_globetrotter_proto_rocktree.Texture.ViewDirection',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NADIR', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NORTH_45', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EAST_45', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SOUTH_45', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='WEST_45', index=4, number=4,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2795,
-  serialized_end=2875,
-)
-_sym_db.RegisterEnumDescriptor(_TEXTURE_VIEWDIRECTION)
-
-
-_BULKMETADATAREQUEST = _descriptor.Descriptor(
-  name='BulkMetadataRequest',
-  full_name='geo_globetrotter_proto_rocktree.BulkMetadataRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_key', full_name='geo_globetrotter_proto_rocktree.BulkMetadataRequest.node_key', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=51,
-  serialized_end=132,
-)
-
-
-_NODEDATAREQUEST = _descriptor.Descriptor(
-  name='NodeDataRequest',
-  full_name='geo_globetrotter_proto_rocktree.NodeDataRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_key', full_name='geo_globetrotter_proto_rocktree.NodeDataRequest.node_key', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='texture_format', full_name='geo_globetrotter_proto_rocktree.NodeDataRequest.texture_format', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='imagery_epoch', full_name='geo_globetrotter_proto_rocktree.NodeDataRequest.imagery_epoch', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=135,
-  serialized_end=308,
-)
-
-
-_NODEKEY = _descriptor.Descriptor(
-  name='NodeKey',
-  full_name='geo_globetrotter_proto_rocktree.NodeKey',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='path', full_name='geo_globetrotter_proto_rocktree.NodeKey.path', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='epoch', full_name='geo_globetrotter_proto_rocktree.NodeKey.epoch', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=310,
-  serialized_end=348,
-)
-
-
-_COPYRIGHTREQUEST = _descriptor.Descriptor(
-  name='CopyrightRequest',
-  full_name='geo_globetrotter_proto_rocktree.CopyrightRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='epoch', full_name='geo_globetrotter_proto_rocktree.CopyrightRequest.epoch', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=350,
-  serialized_end=383,
-)
-
-
-_TEXTUREDATAREQUEST = _descriptor.Descriptor(
-  name='TextureDataRequest',
-  full_name='geo_globetrotter_proto_rocktree.TextureDataRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_key', full_name='geo_globetrotter_proto_rocktree.TextureDataRequest.node_key', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='texture_format', full_name='geo_globetrotter_proto_rocktree.TextureDataRequest.texture_format', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='view_direction', full_name='geo_globetrotter_proto_rocktree.TextureDataRequest.view_direction', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=386,
-  serialized_end=619,
-)
-
-
-_BULKMETADATA = _descriptor.Descriptor(
-  name='BulkMetadata',
-  full_name='geo_globetrotter_proto_rocktree.BulkMetadata',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_metadata', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.node_metadata', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='head_node_key', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.head_node_key', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='head_node_center', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.head_node_center', index=2,
-      number=3, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='meters_per_texel', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.meters_per_texel', index=3,
-      number=4, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_imagery_epoch', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.default_imagery_epoch', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_available_texture_formats', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.default_available_texture_formats', index=5,
-      number=6, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_available_view_dependent_textures', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.default_available_view_dependent_textures', index=6,
-      number=7, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='default_available_view_dependent_texture_formats', full_name='geo_globetrotter_proto_rocktree.BulkMetadata.default_available_view_dependent_texture_formats', index=7,
-      number=8, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=622,
-  serialized_end=1014,
-)
-
-
-_NODEMETADATA = _descriptor.Descriptor(
-  name='NodeMetadata',
-  full_name='geo_globetrotter_proto_rocktree.NodeMetadata',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='path_and_flags', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.path_and_flags', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='epoch', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.epoch', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='bulk_metadata_epoch', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.bulk_metadata_epoch', index=2,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='oriented_bounding_box', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.oriented_bounding_box', index=3,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='meters_per_texel', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.meters_per_texel', index=4,
-      number=4, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='processing_oriented_bounding_box', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.processing_oriented_bounding_box', index=5,
-      number=6, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='imagery_epoch', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.imagery_epoch', index=6,
-      number=7, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='available_texture_formats', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.available_texture_formats', index=7,
-      number=8, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='available_view_dependent_textures', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.available_view_dependent_textures', index=8,
-      number=9, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='available_view_dependent_texture_formats', full_name='geo_globetrotter_proto_rocktree.NodeMetadata.available_view_dependent_texture_formats', index=9,
-      number=10, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _NODEMETADATA_FLAGS,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1017,
-  serialized_end=1443,
-)
-
-
-_NODEDATA = _descriptor.Descriptor(
-  name='NodeData',
-  full_name='geo_globetrotter_proto_rocktree.NodeData',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='matrix_globe_from_mesh', full_name='geo_globetrotter_proto_rocktree.NodeData.matrix_globe_from_mesh', index=0,
-      number=1, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='meshes', full_name='geo_globetrotter_proto_rocktree.NodeData.meshes', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='copyright_ids', full_name='geo_globetrotter_proto_rocktree.NodeData.copyright_ids', index=2,
-      number=3, type=13, cpp_type=3, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='node_key', full_name='geo_globetrotter_proto_rocktree.NodeData.node_key', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='kml_bounding_box', full_name='geo_globetrotter_proto_rocktree.NodeData.kml_bounding_box', index=4,
-      number=5, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='water_mesh', full_name='geo_globetrotter_proto_rocktree.NodeData.water_mesh', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='overlay_surface_meshes', full_name='geo_globetrotter_proto_rocktree.NodeData.overlay_surface_meshes', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='for_normals', full_name='geo_globetrotter_proto_rocktree.NodeData.for_normals', index=7,
-      number=8, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1446,
-  serialized_end=1811,
-)
-
-
-_MESH = _descriptor.Descriptor(
-  name='Mesh',
-  full_name='geo_globetrotter_proto_rocktree.Mesh',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='vertices', full_name='geo_globetrotter_proto_rocktree.Mesh.vertices', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='vertex_alphas', full_name='geo_globetrotter_proto_rocktree.Mesh.vertex_alphas', index=1,
-      number=9, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='texture_coords', full_name='geo_globetrotter_proto_rocktree.Mesh.texture_coords', index=2,
-      number=2, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='indices', full_name='geo_globetrotter_proto_rocktree.Mesh.indices', index=3,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='octant_ranges', full_name='geo_globetrotter_proto_rocktree.Mesh.octant_ranges', index=4,
-      number=4, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='layer_counts', full_name='geo_globetrotter_proto_rocktree.Mesh.layer_counts', index=5,
-      number=5, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='texture', full_name='geo_globetrotter_proto_rocktree.Mesh.texture', index=6,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='texture_coordinates', full_name='geo_globetrotter_proto_rocktree.Mesh.texture_coordinates', index=7,
-      number=7, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='uv_offset_and_scale', full_name='geo_globetrotter_proto_rocktree.Mesh.uv_offset_and_scale', index=8,
-      number=10, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=b'\020\001', file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='layer_and_octant_counts', full_name='geo_globetrotter_proto_rocktree.Mesh.layer_and_octant_counts', index=9,
-      number=8, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='normals', full_name='geo_globetrotter_proto_rocktree.Mesh.normals', index=10,
-      number=11, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='normals_dev', full_name='geo_globetrotter_proto_rocktree.Mesh.normals_dev', index=11,
-      number=16, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='mesh_id', full_name='geo_globetrotter_proto_rocktree.Mesh.mesh_id', index=12,
-      number=12, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='skirt_flags', full_name='geo_globetrotter_proto_rocktree.Mesh.skirt_flags', index=13,
-      number=13, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESH_LAYER,
-    _MESH_LAYERMASK,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1814,
-  serialized_end=2487,
-)
-
-
-_TEXTURE = _descriptor.Descriptor(
-  name='Texture',
-  full_name='geo_globetrotter_proto_rocktree.Texture',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='data', full_name='geo_globetrotter_proto_rocktree.Texture.data', index=0,
-      number=1, type=12, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='format', full_name='geo_globetrotter_proto_rocktree.Texture.format', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='width', full_name='geo_globetrotter_proto_rocktree.Texture.width', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=True, default_value=256,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='geo_globetrotter_proto_rocktree.Texture.height', index=3,
-      number=4, type=13, cpp_type=3, label=1,
-      has_default_value=True, default_value=256,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='view_direction', full_name='geo_globetrotter_proto_rocktree.Texture.view_direction', index=4,
-      number=5, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='mesh_id', full_name='geo_globetrotter_proto_rocktree.Texture.mesh_id', index=5,
-      number=6, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _TEXTURE_FORMAT,
-    _TEXTURE_VIEWDIRECTION,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2490,
-  serialized_end=2875,
-)
-
-
-_TEXTUREDATA = _descriptor.Descriptor(
-  name='TextureData',
-  full_name='geo_globetrotter_proto_rocktree.TextureData',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_key', full_name='geo_globetrotter_proto_rocktree.TextureData.node_key', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='textures', full_name='geo_globetrotter_proto_rocktree.TextureData.textures', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2878,
-  serialized_end=3011,
-)
-
-
-_COPYRIGHTS = _descriptor.Descriptor(
-  name='Copyrights',
-  full_name='geo_globetrotter_proto_rocktree.Copyrights',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='copyrights', full_name='geo_globetrotter_proto_rocktree.Copyrights.copyrights', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3013,
-  serialized_end=3089,
-)
-
-
-_COPYRIGHT = _descriptor.Descriptor(
-  name='Copyright',
-  full_name='geo_globetrotter_proto_rocktree.Copyright',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='geo_globetrotter_proto_rocktree.Copyright.id', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='text', full_name='geo_globetrotter_proto_rocktree.Copyright.text', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='text_clean', full_name='geo_globetrotter_proto_rocktree.Copyright.text_clean', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3091,
-  serialized_end=3148,
-)
-
-
-_PLANETOIDMETADATA = _descriptor.Descriptor(
-  name='PlanetoidMetadata',
-  full_name='geo_globetrotter_proto_rocktree.PlanetoidMetadata',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='root_node_metadata', full_name='geo_globetrotter_proto_rocktree.PlanetoidMetadata.root_node_metadata', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='geo_globetrotter_proto_rocktree.PlanetoidMetadata.radius', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='min_terrain_altitude', full_name='geo_globetrotter_proto_rocktree.PlanetoidMetadata.min_terrain_altitude', index=2,
-      number=3, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='max_terrain_altitude', full_name='geo_globetrotter_proto_rocktree.PlanetoidMetadata.max_terrain_altitude', index=3,
-      number=4, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto2',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3151,
-  serialized_end=3321,
-)
-
-_BULKMETADATAREQUEST.fields_by_name['node_key'].message_type = _NODEKEY
-_NODEDATAREQUEST.fields_by_name['node_key'].message_type = _NODEKEY
-_NODEDATAREQUEST.fields_by_name['texture_format'].enum_type = _TEXTURE_FORMAT
-_TEXTUREDATAREQUEST.fields_by_name['node_key'].message_type = _NODEKEY
-_TEXTUREDATAREQUEST.fields_by_name['texture_format'].enum_type = _TEXTURE_FORMAT
-_TEXTUREDATAREQUEST.fields_by_name['view_direction'].enum_type = _TEXTURE_VIEWDIRECTION
-_BULKMETADATA.fields_by_name['node_metadata'].message_type = _NODEMETADATA
-_BULKMETADATA.fields_by_name['head_node_key'].message_type = _NODEKEY
-_NODEMETADATA_FLAGS.containing_type = _NODEMETADATA
-_NODEDATA.fields_by_name['meshes'].message_type = _MESH
-_NODEDATA.fields_by_name['node_key'].message_type = _NODEKEY
-_NODEDATA.fields_by_name['water_mesh'].message_type = _MESH
-_NODEDATA.fields_by_name['overlay_surface_meshes'].message_type = _MESH
-_MESH.fields_by_name['texture'].message_type = _TEXTURE
-_MESH_LAYER.containing_type = _MESH
-_MESH_LAYERMASK.containing_type = _MESH
-_TEXTURE.fields_by_name['format'].enum_type = _TEXTURE_FORMAT
-_TEXTURE.fields_by_name['view_direction'].enum_type = _TEXTURE_VIEWDIRECTION
-_TEXTURE_FORMAT.containing_type = _TEXTURE
-_TEXTURE_VIEWDIRECTION.containing_type = _TEXTURE
-_TEXTUREDATA.fields_by_name['node_key'].message_type = _NODEKEY
-_TEXTUREDATA.fields_by_name['textures'].message_type = _TEXTURE
-_COPYRIGHTS.fields_by_name['copyrights'].message_type = _COPYRIGHT
-_PLANETOIDMETADATA.fields_by_name['root_node_metadata'].message_type = _NODEMETADATA
-DESCRIPTOR.message_types_by_name['BulkMetadataRequest'] = _BULKMETADATAREQUEST
-DESCRIPTOR.message_types_by_name['NodeDataRequest'] = _NODEDATAREQUEST
-DESCRIPTOR.message_types_by_name['NodeKey'] = _NODEKEY
-DESCRIPTOR.message_types_by_name['CopyrightRequest'] = _COPYRIGHTREQUEST
-DESCRIPTOR.message_types_by_name['TextureDataRequest'] = _TEXTUREDATAREQUEST
-DESCRIPTOR.message_types_by_name['BulkMetadata'] = _BULKMETADATA
-DESCRIPTOR.message_types_by_name['NodeMetadata'] = _NODEMETADATA
-DESCRIPTOR.message_types_by_name['NodeData'] = _NODEDATA
-DESCRIPTOR.message_types_by_name['Mesh'] = _MESH
-DESCRIPTOR.message_types_by_name['Texture'] = _TEXTURE
-DESCRIPTOR.message_types_by_name['TextureData'] = _TEXTUREDATA
-DESCRIPTOR.message_types_by_name['Copyrights'] = _COPYRIGHTS
-DESCRIPTOR.message_types_by_name['Copyright'] = _COPYRIGHT
-DESCRIPTOR.message_types_by_name['PlanetoidMetadata'] = _PLANETOIDMETADATA
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-BulkMetadataRequest = _reflection.GeneratedProtocolMessageType('BulkMetadataRequest', (_message.Message,), {
-  'DESCRIPTOR' : _BULKMETADATAREQUEST,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.BulkMetadataRequest)
-  })
-_sym_db.RegisterMessage(BulkMetadataRequest)
-
-NodeDataRequest = _reflection.GeneratedProtocolMessageType('NodeDataRequest', (_message.Message,), {
-  'DESCRIPTOR' : _NODEDATAREQUEST,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.NodeDataRequest)
-  })
-_sym_db.RegisterMessage(NodeDataRequest)
-
-NodeKey = _reflection.GeneratedProtocolMessageType('NodeKey', (_message.Message,), {
-  'DESCRIPTOR' : _NODEKEY,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.NodeKey)
-  })
-_sym_db.RegisterMessage(NodeKey)
-
-CopyrightRequest = _reflection.GeneratedProtocolMessageType('CopyrightRequest', (_message.Message,), {
-  'DESCRIPTOR' : _COPYRIGHTREQUEST,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.CopyrightRequest)
-  })
-_sym_db.RegisterMessage(CopyrightRequest)
-
-TextureDataRequest = _reflection.GeneratedProtocolMessageType('TextureDataRequest', (_message.Message,), {
-  'DESCRIPTOR' : _TEXTUREDATAREQUEST,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.TextureDataRequest)
-  })
-_sym_db.RegisterMessage(TextureDataRequest)
-
-BulkMetadata = _reflection.GeneratedProtocolMessageType('BulkMetadata', (_message.Message,), {
-  'DESCRIPTOR' : _BULKMETADATA,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.BulkMetadata)
-  })
-_sym_db.RegisterMessage(BulkMetadata)
-
-NodeMetadata = _reflection.GeneratedProtocolMessageType('NodeMetadata', (_message.Message,), {
-  'DESCRIPTOR' : _NODEMETADATA,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.NodeMetadata)
-  })
-_sym_db.RegisterMessage(NodeMetadata)
-
-NodeData = _reflection.GeneratedProtocolMessageType('NodeData', (_message.Message,), {
-  'DESCRIPTOR' : _NODEDATA,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.NodeData)
-  })
-_sym_db.RegisterMessage(NodeData)
-
-Mesh = _reflection.GeneratedProtocolMessageType('Mesh', (_message.Message,), {
-  'DESCRIPTOR' : _MESH,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.Mesh)
-  })
-_sym_db.RegisterMessage(Mesh)
-
-Texture = _reflection.GeneratedProtocolMessageType('Texture', (_message.Message,), {
-  'DESCRIPTOR' : _TEXTURE,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.Texture)
-  })
-_sym_db.RegisterMessage(Texture)
-
-TextureData = _reflection.GeneratedProtocolMessageType('TextureData', (_message.Message,), {
-  'DESCRIPTOR' : _TEXTUREDATA,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.TextureData)
-  })
-_sym_db.RegisterMessage(TextureData)
-
-Copyrights = _reflection.GeneratedProtocolMessageType('Copyrights', (_message.Message,), {
-  'DESCRIPTOR' : _COPYRIGHTS,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.Copyrights)
-  })
-_sym_db.RegisterMessage(Copyrights)
-
-Copyright = _reflection.GeneratedProtocolMessageType('Copyright', (_message.Message,), {
-  'DESCRIPTOR' : _COPYRIGHT,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.Copyright)
-  })
-_sym_db.RegisterMessage(Copyright)
-
-PlanetoidMetadata = _reflection.GeneratedProtocolMessageType('PlanetoidMetadata', (_message.Message,), {
-  'DESCRIPTOR' : _PLANETOIDMETADATA,
-  '__module__' : 'rocktree_pb2'
-  # @@protoc_insertion_point(class_scope:geo_globetrotter_proto_rocktree.PlanetoidMetadata)
-  })
-_sym_db.RegisterMessage(PlanetoidMetadata)
-
-
-_BULKMETADATA.fields_by_name['head_node_center']._options = None
-_BULKMETADATA.fields_by_name['meters_per_texel']._options = None
-_NODEMETADATA.fields_by_name['processing_oriented_bounding_box']._options = None
-_NODEDATA.fields_by_name['matrix_globe_from_mesh']._options = None
-_NODEDATA.fields_by_name['kml_bounding_box']._options = None
-_MESH.fields_by_name['uv_offset_and_scale']._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0erocktree.proto\x12\x1fgeo_globetrotter_proto_rocktree"Q\n\x13BulkMetadataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey"\xad\x01\n\x0fNodeDataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey\x12G\n\x0etexture_format\x18\x02 \x01(\x0e2/.geo_globetrotter_proto_rocktree.Texture.Format\x12\x15\n\rimagery_epoch\x18\x03 \x01(\r"&\n\x07NodeKey\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\r\n\x05epoch\x18\x02 \x01(\r"!\n\x10CopyrightRequest\x12\r\n\x05epoch\x18\x01 \x01(\r"\xe9\x01\n\x12TextureDataRequest\x12:\n\x08node_key\x18\x01 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey\x12G\n\x0etexture_format\x18\x02 \x01(\x0e2/.geo_globetrotter_proto_rocktree.Texture.Format\x12N\n\x0eview_direction\x18\x03 \x01(\x0e26.geo_globetrotter_proto_rocktree.Texture.ViewDirection"\x88\x03\n\x0cBulkMetadata\x12D\n\rnode_metadata\x18\x01 \x03(\x0b2-.geo_globetrotter_proto_rocktree.NodeMetadata\x12?\n\rhead_node_key\x18\x02 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey\x12\x1c\n\x10head_node_center\x18\x03 \x03(\x01B\x02\x10\x01\x12\x1c\n\x10meters_per_texel\x18\x04 \x03(\x02B\x02\x10\x01\x12\x1d\n\x15default_imagery_epoch\x18\x05 \x01(\r\x12)\n!default_available_texture_formats\x18\x06 \x01(\r\x121\n)default_available_view_dependent_textures\x18\x07 \x01(\r\x128\n0default_available_view_dependent_texture_formats\x18\x08 \x01(\r"\xaa\x03\n\x0cNodeMetadata\x12\x16\n\x0epath_and_flags\x18\x01 \x01(\r\x12\r\n\x05epoch\x18\x02 \x01(\r\x12\x1b\n\x13bulk_metadata_epoch\x18\x05 \x01(\r\x12\x1d\n\x15oriented_bounding_box\x18\x03 \x01(\x0c\x12\x18\n\x10meters_per_texel\x18\x04 \x01(\x02\x12,\n processing_oriented_bounding_box\x18\x06 \x03(\x01B\x02\x10\x01\x12\x15\n\rimagery_epoch\x18\x07 \x01(\r\x12!\n\x19available_texture_formats\x18\x08 \x01(\r\x12)\n!available_view_dependent_textures\x18\t \x01(\r\x120\n(available_view_dependent_texture_formats\x18\n \x01(\r"X\n\x05Flags\x12\x0f\n\x0bRICH3D_LEAF\x10\x01\x12\x11\n\rRICH3D_NODATA\x10\x02\x12\x08\n\x04LEAF\x10\x04\x12\n\n\x06NODATA\x10\x08\x12\x15\n\x11USE_IMAGERY_EPOCH\x10\x10"\xed\x02\n\x08NodeData\x12"\n\x16matrix_globe_from_mesh\x18\x01 \x03(\x01B\x02\x10\x01\x125\n\x06meshes\x18\x02 \x03(\x0b2%.geo_globetrotter_proto_rocktree.Mesh\x12\x15\n\rcopyright_ids\x18\x03 \x03(\r\x12:\n\x08node_key\x18\x04 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey\x12\x1c\n\x10kml_bounding_box\x18\x05 \x03(\x01B\x02\x10\x01\x129\n\nwater_mesh\x18\x06 \x01(\x0b2%.geo_globetrotter_proto_rocktree.Mesh\x12E\n\x16overlay_surface_meshes\x18\x07 \x03(\x0b2%.geo_globetrotter_proto_rocktree.Mesh\x12\x13\n\x0bfor_normals\x18\x08 \x01(\x0c"\xa1\x05\n\x04Mesh\x12\x10\n\x08vertices\x18\x01 \x01(\x0c\x12\x15\n\rvertex_alphas\x18\t \x01(\x0c\x12\x16\n\x0etexture_coords\x18\x02 \x01(\x0c\x12\x0f\n\x07indices\x18\x03 \x01(\x0c\x12\x15\n\roctant_ranges\x18\x04 \x01(\x0c\x12\x14\n\x0clayer_counts\x18\x05 \x01(\x0c\x129\n\x07texture\x18\x06 \x03(\x0b2(.geo_globetrotter_proto_rocktree.Texture\x12\x1b\n\x13texture_coordinates\x18\x07 \x01(\x0c\x12\x1f\n\x13uv_offset_and_scale\x18\n \x03(\x02B\x02\x10\x01\x12\x1f\n\x17layer_and_octant_counts\x18\x08 \x01(\x0c\x12\x0f\n\x07normals\x18\x0b \x01(\x0c\x12\x13\n\x0bnormals_dev\x18\x10 \x01(\x0c\x12\x0f\n\x07mesh_id\x18\x0c \x01(\r\x12\x13\n\x0bskirt_flags\x18\r \x01(\x0c"\xd6\x01\n\x05Layer\x12\x0e\n\nOVERGROUND\x10\x00\x12\x17\n\x13TERRAIN_BELOW_WATER\x10\x01\x12\x17\n\x13TERRAIN_ABOVE_WATER\x10\x02\x12\x12\n\x0eTERRAIN_HIDDEN\x10\x03\x12\t\n\x05WATER\x10\x04\x12\x10\n\x0cWATER_SKIRTS\x10\x05\x12\x19\n\x15WATER_SKIRTS_INVERTED\x10\x06\x12\x13\n\x0fOVERLAY_SURFACE\x10\x07\x12\x1a\n\x16OVERLAY_SURFACE_SKIRTS\x10\x08\x12\x0e\n\nNUM_LAYERS\x10\t"[\n\tLayerMask\x12\x1b\n\x17TERRAIN_WITH_OVERGROUND\x10\x07\x12\x16\n\x12TERRAIN_WITH_WATER\x10\x1c\x12\x19\n\x15TERRAIN_WITHOUT_WATER\x10\x0e"\x81\x03\n\x07Texture\x12\x0c\n\x04data\x18\x01 \x03(\x0c\x12?\n\x06format\x18\x02 \x01(\x0e2/.geo_globetrotter_proto_rocktree.Texture.Format\x12\x12\n\x05width\x18\x03 \x01(\r:\x03256\x12\x13\n\x06height\x18\x04 \x01(\r:\x03256\x12N\n\x0eview_direction\x18\x05 \x01(\x0e26.geo_globetrotter_proto_rocktree.Texture.ViewDirection\x12\x0f\n\x07mesh_id\x18\x06 \x01(\r"K\n\x06Format\x12\x07\n\x03JPG\x10\x01\x12\x08\n\x04DXT1\x10\x02\x12\x08\n\x04ETC1\x10\x03\x12\n\n\x06PVRTC2\x10\x04\x12\n\n\x06PVRTC4\x10\x05\x12\x0c\n\x08CRN_DXT1\x10\x06"P\n\rViewDirection\x12\t\n\x05NADIR\x10\x00\x12\x0c\n\x08NORTH_45\x10\x01\x12\x0b\n\x07EAST_45\x10\x02\x12\x0c\n\x08SOUTH_45\x10\x03\x12\x0b\n\x07WEST_45\x10\x04"\x85\x01\n\x0bTextureData\x12:\n\x08node_key\x18\x01 \x01(\x0b2(.geo_globetrotter_proto_rocktree.NodeKey\x12:\n\x08textures\x18\x02 \x03(\x0b2(.geo_globetrotter_proto_rocktree.Texture"L\n\nCopyrights\x12>\n\ncopyrights\x18\x01 \x03(\x0b2*.geo_globetrotter_proto_rocktree.Copyright"9\n\tCopyright\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x12\n\ntext_clean\x18\x03 \x01(\t"\xaa\x01\n\x11PlanetoidMetadata\x12I\n\x12root_node_metadata\x18\x01 \x01(\x0b2-.geo_globetrotter_proto_rocktree.NodeMetadata\x12\x0e\n\x06radius\x18\x02 \x01(\x02\x12\x1c\n\x14min_terrain_altitude\x18\x03 \x01(\x02\x12\x1c\n\x14max_terrain_altitude\x18\x04 \x01(\x02')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'rocktree_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _BULKMETADATA.fields_by_name['head_node_center']._options = None
+  _BULKMETADATA.fields_by_name['head_node_center']._serialized_options = b'\020\001'
+  _BULKMETADATA.fields_by_name['meters_per_texel']._options = None
+  _BULKMETADATA.fields_by_name['meters_per_texel']._serialized_options = b'\020\001'
+  _NODEMETADATA.fields_by_name['processing_oriented_bounding_box']._options = None
+  _NODEMETADATA.fields_by_name['processing_oriented_bounding_box']._serialized_options = b'\020\001'
+  _NODEDATA.fields_by_name['matrix_globe_from_mesh']._options = None
+  _NODEDATA.fields_by_name['matrix_globe_from_mesh']._serialized_options = b'\020\001'
+  _NODEDATA.fields_by_name['kml_bounding_box']._options = None
+  _NODEDATA.fields_by_name['kml_bounding_box']._serialized_options = b'\020\001'
+  _MESH.fields_by_name['uv_offset_and_scale']._options = None
+  _MESH.fields_by_name['uv_offset_and_scale']._serialized_options = b'\020\001'
+  _BULKMETADATAREQUEST._serialized_start=51
+  _BULKMETADATAREQUEST._serialized_end=132
+  _NODEDATAREQUEST._serialized_start=135
+  _NODEDATAREQUEST._serialized_end=308
+  _NODEKEY._serialized_start=310
+  _NODEKEY._serialized_end=348
+  _COPYRIGHTREQUEST._serialized_start=350
+  _COPYRIGHTREQUEST._serialized_end=383
+  _TEXTUREDATAREQUEST._serialized_start=386
+  _TEXTUREDATAREQUEST._serialized_end=619
+  _BULKMETADATA._serialized_start=622
+  _BULKMETADATA._serialized_end=1014
+  _NODEMETADATA._serialized_start=1017
+  _NODEMETADATA._serialized_end=1443
+  _NODEMETADATA_FLAGS._serialized_start=1355
+  _NODEMETADATA_FLAGS._serialized_end=1443
+  _NODEDATA._serialized_start=1446
+  _NODEDATA._serialized_end=1811
+  _MESH._serialized_start=1814
+  _MESH._serialized_end=2487
+  _MESH_LAYER._serialized_start=2180
+  _MESH_LAYER._serialized_end=2394
+  _MESH_LAYERMASK._serialized_start=2396
+  _MESH_LAYERMASK._serialized_end=2487
+  _TEXTURE._serialized_start=2490
+  _TEXTURE._serialized_end=2875
+  _TEXTURE_FORMAT._serialized_start=2718
+  _TEXTURE_FORMAT._serialized_end=2793
+  _TEXTURE_VIEWDIRECTION._serialized_start=2795
+  _TEXTURE_VIEWDIRECTION._serialized_end=2875
+  _TEXTUREDATA._serialized_start=2878
+  _TEXTUREDATA._serialized_end=3011
+  _COPYRIGHTS._serialized_start=3013
+  _COPYRIGHTS._serialized_end=3089
+  _COPYRIGHT._serialized_start=3091
+  _COPYRIGHT._serialized_end=3148
+  _PLANETOIDMETADATA._serialized_start=3151
+  _PLANETOIDMETADATA._serialized_end=3321
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,192 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bulk_columns import BulkColumns
+from bulk_columns import decode_bulk_metadata
+from bulk_metadata import node_column
+from find_overlaps import read_bulk_metadata_many
+from find_overlaps import read_planetoid_metadata
+from octant_keys import pack_path
+from octant_to_latlong import octant_to_latlong
+from octant_to_latlong import octant_to_latlong_batch
+
+MAGIC = b"RTSNAP1\n"
+ALIGNMENT = 64
+
+COLUMNS = [
+    ("path", np.uint64),
+    ("head", np.uint64),
+    ("level", np.uint8),
+    ("flags", np.uint32),
+    ("epoch", np.uint32),
+    ("bulk_metadata_epoch", np.uint32),
+    ("imagery_epoch", np.uint32),
+    ("available_texture_formats", np.uint32),
+    ("meters_per_texel", np.float32),
+]
+
+
+def _touches_prefix(columns, prefix):
+    """Mask of the rows whose box overlaps the box of `prefix`.
+
+    These are the rows a walk over any region inside that box can reach:
+    its ancestors and descendants, but also the altitude twins that share
+    their boxes and the neighbours touching its edges.
+    """
+    return columns.overlaps(octant_to_latlong(prefix))
+
+
+def _node_columns(bulk, columns):
+    count = len(columns)
+    head = np.full(count, pack_path(bulk.head_node_key.path), dtype=np.uint64)
+    imagery_epoch = node_column(bulk, "imagery_epoch")
+    texture_formats = node_column(bulk, "available_texture_formats")
+    return {
+        "path": columns.path,
+        "head": head,
+        "level": columns.level,
+        "flags": columns.flags,
+        "epoch": node_column(bulk, "epoch"),
+        "bulk_metadata_epoch": columns.epoch,
+        "imagery_epoch": np.where(imagery_epoch, imagery_epoch, bulk.default_imagery_epoch),
+        "available_texture_formats": np.where(
+            texture_formats, texture_formats, bulk.default_available_texture_formats),
+        "meters_per_texel": node_column(bulk, "meters_per_texel"),
+    }
+
+
+def export_snapshot(filename, prefix, concurrency=8):
+    """Write every node whose box overlaps that of `prefix` to `filename`.
+
+    The walk starts at the root so the snapshot can answer `find_overlaps`
+    queries for any region inside the `prefix` octant.
+    """
+    root_epoch = read_planetoid_metadata().root_node_metadata.epoch
+    parts = []
+    keys = [("", root_epoch)]
+    with ThreadPoolExecutor(concurrency) as executor:
+        while keys:
+            next_keys = []
+            for bulk in read_bulk_metadata_many(keys, executor):
+                columns = decode_bulk_metadata(bulk)
+                keep = _touches_prefix(columns, prefix)
+                parts.append({name: column[keep]
+                              for name, column in _node_columns(bulk, columns).items()})
+                expand = keep & (columns.level % 4 == 0) & ((columns.flags & 4) == 0)
+                for i in np.flatnonzero(expand):
+                    next_keys.append((columns.path_string(i), int(columns.epoch[i])))
+            keys = next_keys
+
+    merged = {name: np.concatenate([part[name] for part in parts]).astype(dtype)
+              for name, dtype in COLUMNS}
+    order = np.argsort(merged["head"], kind="stable")
+    write_snapshot(filename, {name: column[order] for name, column in merged.items()},
+                   root_epoch=root_epoch, prefix=prefix)
+
+
+def write_snapshot(filename, columns, **attributes):
+    count = len(columns["path"])
+    header = {"count": count, "columns": [], **attributes}
+    offset = 0
+    for name, dtype in COLUMNS:
+        header["columns"].append({"name": name, "dtype": np.dtype(dtype).str, "offset": offset})
+        offset += -(-count * np.dtype(dtype).itemsize // ALIGNMENT) * ALIGNMENT
+    header_bytes = json.dumps(header).encode()
+    data_start = -(-(len(MAGIC) + 8 + len(header_bytes)) // ALIGNMENT) * ALIGNMENT
+
+    with open(filename, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(8, "little"))
+        f.write(header_bytes)
+        for column in header["columns"]:
+            f.seek(data_start + column["offset"])
+            f.write(np.ascontiguousarray(columns[column["name"]], dtype=column["dtype"]).tobytes())
+        f.truncate(data_start + offset)
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a file written by `export_snapshot`.
+
+    Columns are views into one shared mapping, so opening is cheap and
+    processes reading the same file share it through the page cache.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._map = np.memmap(filename, dtype=np.uint8, mode="r")
+        if bytes(self._map[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{filename} is not a rocktree snapshot")
+        header_length = int.from_bytes(bytes(self._map[len(MAGIC):len(MAGIC) + 8]), "little")
+        header_end = len(MAGIC) + 8 + header_length
+        self.header = json.loads(bytes(self._map[len(MAGIC) + 8:header_end]))
+        data_start = -(-header_end // ALIGNMENT) * ALIGNMENT
+        self.columns = {
+            column["name"]: np.frombuffer(
+                self._map, dtype=column["dtype"], count=self.header["count"],
+                offset=data_start + column["offset"])
+            for column in self.header["columns"]
+        }
+
+    def __len__(self):
+        return self.header["count"]
+
+    @property
+    def root_epoch(self):
+        return self.header["root_epoch"]
+
+    @property
+    def prefix(self):
+        return self.header["prefix"]
+
+    def covers(self, region):
+        """Whether `region` lies inside the `prefix` octant the snapshot holds."""
+        if not self.prefix:
+            return True
+        if hasattr(region, "geom_type"):
+            west, south, east, north = region.bounds
+        else:
+            north, south, west, east = region
+        box = octant_to_latlong(self.prefix)
+        return box.south <= south and north <= box.north and box.west <= west and east <= box.east
+
+    def bulk_epoch(self, path):
+        """Epoch recorded for the bulk packet at `path`, None if it was not exported."""
+        if not path:
+            return self.root_epoch
+        head = self.columns["head"]
+        parent = np.uint64(pack_path(path[:len(path) - 4]))
+        start, stop = np.searchsorted(head, parent, side="left"), np.searchsorted(head, parent, side="right")
+        rows = np.flatnonzero(self.columns["path"][start:stop] == np.uint64(pack_path(path)))
+        if len(path) % 4 or not len(rows):
+            return None
+        return int(self.columns["bulk_metadata_epoch"][start + rows[0]])
+
+    def bulk_columns(self, path, epoch=None):
+        """Columns of the bulk packet at `path`, as `decode_bulk_metadata` gives them.
+
+        Raises ValueError for packets the snapshot does not hold: those
+        whose box does not overlap that of `prefix`, or of another `epoch`.
+        """
+        if not octant_to_latlong(path).overlaps_with(octant_to_latlong(self.prefix)):
+            raise ValueError(f"bulk packet {path!r} is outside snapshot prefix {self.prefix!r}")
+        recorded = self.bulk_epoch(path)
+        if recorded is None:
+            raise ValueError(f"no bulk packet {path!r} in snapshot {self.filename}")
+        if epoch is not None and epoch != recorded:
+            raise ValueError(f"bulk packet {path!r} has epoch {recorded} in snapshot, not {epoch}")
+        head = self.columns["head"]
+        key = np.uint64(pack_path(path))
+        start, stop = np.searchsorted(head, key, side="left"), np.searchsorted(head, key, side="right")
+        rows = slice(start, stop)
+        packed = np.array(self.columns["path"][rows])
+        level = np.array(self.columns["level"][rows])
+        n, s, w, e = octant_to_latlong_batch(packed, prefix=path)
+        return BulkColumns(None, packed, level, np.array(self.columns["flags"][rows]),
+                           np.array(self.columns["bulk_metadata_epoch"][rows]), n, s, w, e)
+
+
+if __name__ == "__main__":
+    export_snapshot(sys.argv[2], sys.argv[1])
@@ -0,0 +1,190 @@
+import functools
+import re
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import find_overlaps
+from octant_to_latlong import LatLonBox
+from octant_to_latlong import first_latlonbox_dict
+from octant_to_latlong import octant_to_latlong
+from proto.rocktree_pb2 import BulkMetadata
+from proto.rocktree_pb2 import NodeMetadata
+from proto.rocktree_pb2 import PlanetoidMetadata
+from transport import Transport
+from transport import set_transport
+
+ROOT_EPOCH = 990
+REGION = LatLonBox(north=37.4206, south=37.4197, west=-122.0850, east=-122.0833)
+
+
+# Levels whose octants are split by altitude too, into digits 0-7.
+TWIN_LEVELS = (14, 18, 19, 20)
+
+
+def child_paths(path, twin_levels=TWIN_LEVELS):
+    if len(path) < 2:
+        return [p for p in first_latlonbox_dict if len(p) == len(path) + 1 and p.startswith(path)]
+    digits = "01234567" if len(path) + 1 in twin_levels else "0123"
+    return [path + d for d in digits]
+
+
+def node_flags(path):
+    flags = 0
+    if len(path) == 20:
+        flags |= NodeMetadata.LEAF
+        if path[-1] in "4567":
+            flags |= NodeMetadata.NODATA
+    return flags
+
+
+def pack_path_and_flags(relative_path, flags):
+    value = len(relative_path) - 1
+    for i, digit in enumerate(relative_path):
+        value |= int(digit) << (2 + 3 * i)
+    return value | flags << (2 + 3 * len(relative_path))
+
+
+def rich_bulk_metadata():
+    """Serialized BulkMetadata that sets every NodeMetadata field."""
+    bulk = BulkMetadata()
+    bulk.head_node_key.path = "20527061"
+    bulk.head_node_key.epoch = 991
+    bulk.head_node_center.extend([1.5, -2.5, 3.0])
+    bulk.meters_per_texel.extend([4.0, 2.0])
+    bulk.default_imagery_epoch = 300
+    bulk.default_available_texture_formats = 1
+    for i, path in enumerate(["0", "01", "012", "0123", "7", "7654"]):
+        node = bulk.node_metadata.add()
+        node.path_and_flags = pack_path_and_flags(path, i * 3 % 32)
+        node.epoch = 2 ** 31 + i
+        node.oriented_bounding_box = bytes(range(15))
+        node.meters_per_texel = 0.25
+        node.processing_oriented_bounding_box.extend([0.5] * 3)
+        if i % 2:
+            node.imagery_epoch = 300 + i
+            node.available_texture_formats = 6
+            node.bulk_metadata_epoch = 992
+        node.available_view_dependent_textures = i
+        node.available_view_dependent_texture_formats = 2
+    return bulk.SerializeToString()
+
+
+class FakeWorld:
+    """Synthetic rocktree covering `region` down to level 20."""
+
+    def __init__(self, region=REGION, twin_levels=TWIN_LEVELS):
+        self.region = region
+        self.nodes = {}
+        stack = [""]
+        while stack:
+            path = stack.pop()
+            for child in child_paths(path, twin_levels):
+                if octant_to_latlong(child).overlaps_with(region):
+                    self.nodes[child] = node_flags(child)
+                    if len(child) < 20:
+                        stack.append(child)
+        self.requests = []
+
+    @staticmethod
+    def epoch(path):
+        return ROOT_EPOCH + len(path) // 4
+
+    def planetoid_metadata(self):
+        metadata = PlanetoidMetadata()
+        metadata.root_node_metadata.epoch = ROOT_EPOCH
+        return metadata.SerializeToString()
+
+    @functools.lru_cache(maxsize=None)
+    def bulk_metadata(self, path, epoch):
+        if path and path not in self.nodes or epoch != self.epoch(path):
+            return None
+        bulk = BulkMetadata()
+        bulk.head_node_key.path = path
+        bulk.head_node_key.epoch = epoch
+        bulk.default_imagery_epoch = 300
+        for node_path in sorted(self.nodes, key=lambda p: (len(p), p)):
+            if len(node_path) <= len(path) or len(node_path) > len(path) + 4:
+                continue
+            if not node_path.startswith(path):
+                continue
+            node = bulk.node_metadata.add()
+            node.path_and_flags = pack_path_and_flags(
+                node_path[len(path):], self.nodes[node_path])
+            node.epoch = epoch
+            if len(node_path) % 4 == 0:
+                node.bulk_metadata_epoch = self.epoch(node_path)
+            node.meters_per_texel = 2.0 ** (24 - len(node_path))
+        return bulk.SerializeToString()
+
+    def respond(self, resource):
+        self.requests.append(resource)
+        if resource == "earth/PlanetoidMetadata":
+            return self.planetoid_metadata()
+        match = re.fullmatch(r"earth/BulkMetadata/pb=!1m2!1s([0-7]*)!2u(\d+)", resource)
+        if match:
+            return self.bulk_metadata(match.group(1), int(match.group(2)))
+        return None
+
+
+def bulk_payloads(rich=True):
+    """Serialized bulk packets of a `FakeWorld`, after `rich_bulk_metadata` if `rich`."""
+    world = FakeWorld()
+    paths = [""] + [p for p in world.nodes if len(p) % 4 == 0 and len(p) < 20]
+    payloads = [rich_bulk_metadata()] if rich else []
+    return payloads + [world.bulk_metadata(path, world.epoch(path)) for path in paths]
+
+
+def paths_by_level(overlaps):
+    return {level: [octant.path for octant in octants]
+            for level, octants in overlaps.items()}
+
+
+def serve(world):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            data = world.respond(self.path[1:])
+            if data is None:
+                data = 404
+            if isinstance(data, int):
+                self.send_response(data)
+                data = b""
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _installed(world, monkeypatch):
+    server = serve(world)
+    transport = Transport(base_url=f"http://127.0.0.1:{server.server_address[1]}/")
+    previous = set_transport(transport)
+    monkeypatch.setattr(find_overlaps, "metadata_cache", None)
+    yield world
+    set_transport(previous)
+    transport.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_world(monkeypatch):
+    yield from _installed(FakeWorld(), monkeypatch)
+
+
+@pytest.fixture
+def twin_world(monkeypatch):
+    """A `fake_world` whose octants are split by altitude from level 3 on."""
+    yield from _installed(FakeWorld(twin_levels=(3,) + TWIN_LEVELS), monkeypatch)
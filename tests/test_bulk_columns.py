@@ -0,0 +1,47 @@
+from conftest import bulk_payloads
+from conftest import pack_path_and_flags
+from bulk_columns import decode_bulk_metadata
+from find_overlaps import Octant
+from octant_to_latlong import first_latlonbox_dict
+from proto.rocktree_pb2 import BulkMetadata
+
+
+def _world_root_bulk():
+    paths = [p for p in first_latlonbox_dict if p]
+    paths += [p + d for p in paths if len(p) == 2 for d in "01234567"]
+    paths += [p + d for p in paths if len(p) == 3 for d in "0123"]
+    bulk = BulkMetadata()
+    bulk.head_node_key.epoch = 990
+    for path in paths:
+        bulk.node_metadata.add().path_and_flags = pack_path_and_flags(path, 4)
+    return bulk
+
+
+def _world_bulks():
+    for data in bulk_payloads(rich=False):
+        bulk = BulkMetadata()
+        bulk.ParseFromString(data)
+        yield bulk
+
+
+def test_columns_match_octants():
+    for bulk in [_world_root_bulk(), *_world_bulks()]:
+        columns = decode_bulk_metadata(bulk)
+        assert len(columns) == len(bulk.node_metadata)
+        for i, node_data in enumerate(bulk.node_metadata):
+            octant = Octant(bulk.head_node_key, node_data)
+            assert columns.path_string(i) == octant.path
+            assert columns.level[i] == octant.level
+            assert columns.flags[i] == octant.flags
+            assert columns.epoch[i] == octant.epoch
+            box = (columns.north[i], columns.south[i], columns.west[i], columns.east[i])
+            assert box == tuple(octant.bbox)
+
+
+def test_overlap_mask():
+    bulk = _world_root_bulk()
+    columns = decode_bulk_metadata(bulk)
+    box = first_latlonbox_dict["20"]
+    for i, node_data in enumerate(bulk.node_metadata):
+        octant = Octant(bulk.head_node_key, node_data)
+        assert columns.overlaps(box)[i] == octant.bbox.overlaps_with(box)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from conftest import bulk_payloads
+from conftest import rich_bulk_metadata
+from bulk_columns import decode_bulk_metadata
+from bulk_metadata import NODE_FIELDS
+from bulk_metadata import LazyBulkMetadata
+from bulk_metadata import node_column
+from proto.rocktree_pb2 import BulkMetadata
+
+
+def test_lazy_columns_match_protobuf():
+    for data in bulk_payloads():
+        bulk = BulkMetadata()
+        bulk.ParseFromString(data)
+        lazy = LazyBulkMetadata(data)
+        assert len(lazy) == len(bulk.node_metadata)
+        assert tuple(lazy.head_node_key) == (bulk.head_node_key.path, bulk.head_node_key.epoch)
+        assert lazy.default_imagery_epoch == bulk.default_imagery_epoch
+        assert lazy.default_available_texture_formats == bulk.default_available_texture_formats
+        for name in NODE_FIELDS:
+            np.testing.assert_array_equal(node_column(lazy, name), node_column(bulk, name))
+
+        expected, columns = decode_bulk_metadata(bulk), decode_bulk_metadata(lazy)
+        for field in expected._fields[1:]:
+            np.testing.assert_array_equal(getattr(columns, field), getattr(expected, field))
+
+
+def test_full_parse_only_on_demand():
+    data = rich_bulk_metadata()
+    lazy = LazyBulkMetadata(data)
+    decode_bulk_metadata(lazy)
+    lazy.node_column("meters_per_texel")
+    assert lazy._message is None
+    assert lazy.node_metadata[3].oriented_bounding_box == bytes(range(15))
+    assert list(lazy.head_node_center) == [1.5, -2.5, 3.0]
+
+
+def test_truncated_payload():
+    with pytest.raises(ValueError):
+        LazyBulkMetadata(rich_bulk_metadata()[:-20])
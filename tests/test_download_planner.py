@@ -0,0 +1,72 @@
+import numpy as np
+
+from conftest import REGION
+from bulk_columns import BulkColumns
+from download_planner import plan_downloads
+from download_planner import plan_octant
+from find_overlaps import Octant
+from find_overlaps import find_overlaps
+from find_overlaps import find_overlaps_many
+from find_overlaps import iter_overlaps_many
+from octant_keys import pack_path
+from proto.rocktree_pb2 import NodeMetadata
+
+
+def _octant(path, flags):
+    columns = BulkColumns(None, np.array([pack_path(path)], dtype=np.uint64), None,
+                          np.array([flags]), np.array([1]), *np.zeros((4, 1)))
+    return Octant.from_columns(columns, 0)
+
+
+def test_flags_decoded():
+    octant = _octant("0123", 31)
+    assert octant.is_leaf and octant.is_nodata and octant.uses_imagery_epoch
+    assert octant.is_rich3d_leaf and octant.is_rich3d_nodata
+    octant = _octant("0123", NodeMetadata.RICH3D_NODATA)
+    assert octant.is_rich3d_nodata
+    assert not (octant.is_leaf or octant.is_nodata or octant.is_rich3d_leaf or octant.uses_imagery_epoch)
+
+
+def test_plan_skips_nodata(fake_world):
+    overlaps = find_overlaps(REGION, target_level=20)
+    plan = plan_downloads(overlaps, 20)
+    assert plan.leaves == []
+    assert {o.path for o in plan.octants} | {o.path for o in plan.nodata} == \
+        {o.path for o in overlaps[20]}
+    assert plan.nodata and all(o.path[-1] in "4567" for o in plan.nodata)
+    assert all(o.path[-1] in "0123" for o in plan.octants)
+
+
+def test_plan_stops_at_leaves():
+    leaf = _octant("02123", NodeMetadata.LEAF)
+    empty_leaf = _octant("02121", NodeMetadata.LEAF | NodeMetadata.NODATA)
+    overlaps = {
+        4: [_octant("0212", 0)],
+        5: [leaf, empty_leaf, _octant("02120", 0)],
+        6: [_octant("021200", 0), _octant("021204", NodeMetadata.NODATA)],
+        7: [_octant("0212000", 0)],
+    }
+    plan = plan_downloads(overlaps, 6)
+    assert plan.octants == [leaf, overlaps[6][0]]
+    assert plan.leaves == [leaf]
+    assert plan.nodata == [empty_leaf, overlaps[6][1]]
+    assert plan_downloads(overlaps).octants == [leaf, overlaps[7][0]]
+
+
+def test_plan_after_target_level_walk(fake_world):
+    # End the tree early under one level-18 octant, as main.py would meet it
+    leaf = sorted(p for p in fake_world.nodes if len(p) == 18)[0]
+    for path in [p for p in fake_world.nodes if len(p) > 18 and p.startswith(leaf)]:
+        del fake_world.nodes[path]
+    fake_world.nodes[leaf] |= NodeMetadata.LEAF
+
+    overlaps = find_overlaps_many([REGION], target_level=20, leaves=True)[0]
+    plan = plan_downloads(overlaps, 20)
+    assert [o.path for o in plan.leaves] == [leaf]
+    assert leaf in {o.path for o in plan.octants}
+    assert {o.path for o in plan.octants if o.level == 20} == \
+        {p for p in fake_world.nodes if len(p) == 20 and p[-1] in "0123"}
+
+    streamed = [octant for octant, _ in iter_overlaps_many([REGION], target_level=20, leaves=True)
+                if plan_octant(octant, 20) in ("octant", "leaf")]
+    assert sorted(o.path for o in streamed) == sorted(o.path for o in plan.octants)
@@ -0,0 +1,161 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import requests
+
+from conftest import serve
+from downloader import Downloader
+from downloader import TileKey
+from downloader import TokenBucket
+from downloader import node_data_resource
+from tile_store import TileStore
+from transport import Transport
+
+
+class FlakyTiles:
+    """Serves tile "<path>" after failing it `failures[path]` times with 503."""
+
+    def __init__(self, tiles, failures=None, status=None):
+        self.tiles = tiles
+        self.failures = dict(failures or {})
+        self.status = status or {}
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def respond(self, resource):
+        path = resource.split("!1s")[1].split("!")[0]
+        with self._lock:
+            self.requests.append(path)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+            if self.failures.get(path, 0) > 0:
+                self.failures[path] -= 1
+                return 503
+        return self.status.get(path, self.tiles.get(path))
+
+
+def _downloader(world, **kwargs):
+    server = serve(world)
+    transport = Transport(base_url=f"http://127.0.0.1:{server.server_address[1]}/")
+    return server, Downloader(transport, sleep=lambda seconds: None, **kwargs)
+
+
+def test_downloads_with_retries_and_statuses():
+    tiles = {str(i): f"tile {i}".encode() for i in range(20)}
+    world = FlakyTiles(tiles, failures={"3": 2, "4": 10}, status={"5": 403})
+    server, downloader = _downloader(world, concurrency=4, retries=3)
+    keys = [TileKey(path, 990, 350, 1036419) for path in list(tiles) + ["missing"]]
+    try:
+        results = {result.key.path: result for result in downloader.download(keys)}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert set(results) == {key.path for key in keys}
+    assert results["0"].status == "ok" and results["0"].data == b"tile 0"
+    assert results["3"].status == "ok" and results["3"].attempts == 3
+    assert results["4"].status == "failed" and results["4"].attempts == 4
+    assert results["5"].status == "failed" and results["5"].attempts == 1
+    assert results["missing"].status == "missing"
+    assert world.requests.count("4") == 4
+    assert 1 < world.max_active <= 4
+
+
+def test_download_keeps_a_bounded_window():
+    tiles = {str(i): f"tile {i}".encode() for i in range(40)}
+    server, downloader = _downloader(FlakyTiles(tiles), concurrency=2, window=4)
+    taken = []
+
+    def keys():
+        for path in tiles:
+            taken.append(path)
+            yield TileKey(path, 990, 350, 1036419)
+
+    try:
+        results = []
+        for result in downloader.download(keys()):
+            assert len(taken) - len(results) <= 4
+            results.append(result.key.path)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert sorted(results) == sorted(tiles)
+
+
+def test_resource_format():
+    key = TileKey("30524153625370535063", 990, 350, 1036419)
+    assert node_data_resource(key) == \
+        "tm/earth/NodeData/pb=!1m2!1s30524153625370535063!2u990!2e1!3u350!4b0!5i1036419"
+
+
+def test_token_bucket_limits_rate():
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=10, burst=5, clock=lambda: now[0], sleep=sleep)
+    for _ in range(25):
+        bucket.acquire()
+    assert abs(now[0] - 2.0) < 1e-9
+
+
+def test_reads_through_tile_store(tmp_path):
+    world = FlakyTiles({"1": b"one", "2": b"two"})
+    server, downloader = _downloader(world, store=TileStore(tmp_path))
+    keys = [TileKey(path, 990, 350, 1036419) for path in ["1", "2", "3"]]
+    try:
+        first = sorted(downloader.download(keys))
+        second = sorted(downloader.download(keys))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert [r.data for r in first] == [r.data for r in second] == [b"one", b"two", None]
+    assert [r.attempts for r in second] == [0, 0, 1]
+    assert sorted(world.requests) == ["1", "2", "3", "3"]
+
+
+def test_retries_truncated_bodies():
+    truncated = {"1": 2, "2": 10}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = self.path.split("!1s")[1].split("!")[0]
+            data = f"tile {path}".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data) + 100))
+            self.end_headers()
+            if truncated.get(path, 0) > 0:
+                truncated[path] -= 1
+                self.wfile.write(data[:3])
+                self.close_connection = True
+                return
+            self.wfile.write(data + bytes(100))
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    transport = Transport(base_url=f"http://127.0.0.1:{server.server_address[1]}/")
+    downloader = Downloader(transport, retries=3, sleep=lambda seconds: None)
+    keys = [TileKey(path, 990, 350, 1036419) for path in ["0", "1", "2"]]
+    try:
+        results = {result.key.path: result for result in downloader.download(keys)}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert results["0"].status == "ok" and results["0"].attempts == 1
+    assert results["1"].status == "ok" and results["1"].attempts == 3
+    assert results["1"].data.startswith(b"tile 1")
+    assert results["2"].status == "failed" and results["2"].attempts == 4
+    assert isinstance(results["2"].error, requests.exceptions.ChunkedEncodingError)
@@ -0,0 +1,74 @@
+import find_overlaps
+from conftest import REGION
+from conftest import pack_path_and_flags
+from conftest import rich_bulk_metadata
+from bulk_columns import decode_bulk_metadata
+from bulk_metadata import LazyBulkMetadata
+from find_overlaps import find_overlaps as find
+from imagery_index import ImageryIndex
+from imagery_index import ImageryInfo
+from proto.rocktree_pb2 import BulkMetadata
+from proto.rocktree_pb2 import NodeMetadata
+
+
+def test_index_filled_by_traversal(fake_world, tmp_path, monkeypatch):
+    index = ImageryIndex(tmp_path / "imagery.sqlite")
+    monkeypatch.setattr(find_overlaps, "imagery_index", index)
+    octant = find(REGION, target_level=20)[20][0]
+    info = index.node(octant.path)
+    assert info == ImageryInfo(fake_world.epoch(octant.path[:16]), 300, 0, octant.flags)
+    assert index.available(octant.path) == [(None, None)]
+    assert index.node("7") is None
+
+
+def test_probes_persist(tmp_path):
+    index = ImageryIndex(tmp_path / "imagery.sqlite")
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(rich_bulk_metadata())))
+    assert index.node("205270610") == ImageryInfo(2 ** 31, 300, 1, 0)
+    assert index.node("2052706101").imagery_epoch == 301
+    assert index.node("2052706101").texture_formats == 6
+
+    index.record("205270610", 253, 1033769, False)
+    index.record("205270610", 350, 1036419, True)
+    index.close()
+
+    index = ImageryIndex(tmp_path / "imagery.sqlite")
+    assert not index.should_request("205270610", 253, 1033769)
+    assert index.should_request("205270610", 350, 1036419)
+    assert index.should_request("205270610", 215, 1032357)
+    assert index.available("205270610") == [(None, None), (350, 1036419)]
+
+
+def test_nodes_written_in_batches(tmp_path):
+    index = ImageryIndex(tmp_path / "imagery.sqlite", flush_rows=10)
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(rich_bulk_metadata())))
+    assert index._db.execute("SELECT COUNT(*) FROM nodes").fetchone() == (0,)
+    assert index.node("205270610").imagery_epoch == 300
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(rich_bulk_metadata())))
+    assert index._db.execute("SELECT COUNT(*) FROM nodes").fetchone() == (0,)
+    bulk = BulkMetadata()
+    bulk.head_node_key.path = "2052706"
+    for digit in "01234567":
+        bulk.node_metadata.add().path_and_flags = pack_path_and_flags(digit, 0)
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(bulk.SerializeToString())))
+    assert index._db.execute("SELECT COUNT(*) FROM nodes").fetchone() == (14,)
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(rich_bulk_metadata())))
+    index.close()
+    assert ImageryIndex(tmp_path / "imagery.sqlite").node("205270617654").epoch == 2 ** 31 + 5
+
+
+def test_newer_imagery_skipped_up_front(tmp_path):
+    bulk = BulkMetadata()
+    bulk.head_node_key.path = "2052706"
+    bulk.default_imagery_epoch = 300
+    for digit, flags in [("0", NodeMetadata.USE_IMAGERY_EPOCH), ("1", 0)]:
+        bulk.node_metadata.add().path_and_flags = pack_path_and_flags(digit, flags)
+    index = ImageryIndex(tmp_path / "imagery.sqlite")
+    index.add_columns(decode_bulk_metadata(LazyBulkMetadata(bulk.SerializeToString())))
+    assert index.should_request("20527060", 253, 1033769)
+    assert index.should_request("20527060", 300, None)
+    assert not index.should_request("20527060", 350, 1036419)
+    assert index.should_request("20527061", 350, 1036419)
+    assert index.should_request("2052706", 350, 1036419)
+    index.record("20527060", 350, 1036419, True)
+    assert index.should_request("20527060", 350, 1036419)
@@ -0,0 +1,52 @@
+import pytest
+
+from conftest import REGION
+from level_selection import choose_level
+from level_selection import region_size
+from level_selection import sampled_meters_per_texel
+from level_selection import sampled_meters_per_texel_many
+from octant_to_latlong import LatLonBox
+from octant_to_latlong import cover_region
+
+
+def test_choose_level_is_coarsest_reaching_resolution():
+    for resolution in (128, 256, 512):
+        choice = choose_level(REGION, resolution=resolution)
+        assert choice.pixels >= resolution
+        assert choice.tiles == len(cover_region(REGION, choice.level))
+        coarser = choose_level(REGION, resolution=resolution, max_level=choice.level - 1)
+        assert coarser.pixels < resolution
+
+
+def test_choose_level_respects_max_tiles():
+    choice = choose_level(REGION, resolution=10 ** 6, max_tiles=16)
+    assert choice.tiles <= 16
+    assert len(cover_region(REGION, choice.level + 1)) > 16
+    assert choose_level(REGION, max_tiles=16) == choice
+
+
+def test_choose_level_scales_meters_per_texel():
+    width, height = region_size(REGION)
+    choice = choose_level(REGION, resolution=256, meters_per_texel=2.0)
+    assert choice.level == 18
+    assert choice.meters_per_texel == 0.5
+    assert choice.pixels == pytest.approx(max(width, height) / 0.5)
+
+
+def test_choose_level_needs_a_target():
+    with pytest.raises(ValueError):
+        choose_level(REGION)
+
+
+def test_sampled_meters_per_texel(fake_world):
+    assert sampled_meters_per_texel(REGION) == 2.0 ** (24 - 16)
+    assert sampled_meters_per_texel(REGION, level=18) == 2.0 ** (24 - 18)
+
+
+def test_sampled_meters_per_texel_many_shares_packets(fake_world):
+    n, s, w, e = REGION
+    regions = [REGION, LatLonBox(n, (n + s) / 2, w, (w + e) / 2)]
+    fake_world.requests.clear()
+    assert sampled_meters_per_texel_many(regions, concurrency=4) == [2.0 ** 8] * 2
+    bulk_requests = [r for r in fake_world.requests if "BulkMetadata" in r]
+    assert len(bulk_requests) == len(set(bulk_requests))
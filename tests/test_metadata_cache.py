@@ -0,0 +1,50 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from metadata_cache import MetadataCache
+
+
+def test_hits_and_misses(tmp_path):
+    cache = MetadataCache(tmp_path)
+    assert cache.get("earth", "2052", 990) is None
+    cache.put("earth", "2052", 990, b"bulk")
+    assert cache.get("earth", "2052", 990) == b"bulk"
+    assert cache.get("earth", "2052", 991) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_eviction(tmp_path):
+    cache = MetadataCache(tmp_path, max_bytes=8)
+    cache.put("earth", "", 1, b"aaaa")
+    cache.put("earth", "2052", 1, b"bbbb")
+    assert cache.get("earth", "", 1) == b"aaaa"
+    cache.put("earth", "20527061", 1, b"cccc")
+    assert cache.get("earth", "2052", 1) is None
+    assert cache.get("earth", "", 1) == b"aaaa"
+    assert cache.stats()["bytes"] == 8
+
+
+def test_persists_between_instances(tmp_path):
+    MetadataCache(tmp_path).put("earth", "PlanetoidMetadata", None, b"root")
+    cache = MetadataCache(tmp_path)
+    assert cache.get("earth", "PlanetoidMetadata", None) == b"root"
+    assert cache.get("earth", "PlanetoidMetadata", None, max_age=-1) is None
+
+
+def test_concurrent_misses_read_once(tmp_path):
+    cache = MetadataCache(tmp_path)
+    reads = []
+
+    def read():
+        reads.append(1)
+        time.sleep(0.05)
+        return b"bulk"
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: cache.fetch("earth", "2052", 990, read), range(8)))
+    assert results == [b"bulk"] * 8
+    assert len(reads) == 1
+    assert cache.fetch("earth", "2052", 990, read) == b"bulk"
+    assert len(reads) == 1
+
@@ -0,0 +1,99 @@
+import io
+import random
+
+import numpy as np
+import pytest
+
+from mosaic import build_mosaic
+from mosaic import grid_positions
+from octant_to_latlong import latlon_to_octant
+from octant_to_latlong import octant_to_latlong
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _random_paths(level, count, rng):
+    paths = []
+    while len(paths) < count:
+        first = rng.choice("0123")
+        path = first + rng.choice("23" if first in "01" else "01") + "".join(rng.choice("01234567") for _ in range(level - 2))
+        paths.append(path[:level])
+    return paths
+
+
+def test_grid_positions_match_boxes():
+    rng = random.Random(0)
+    for level in [1, 2, 3, 7, 20]:
+        paths = _random_paths(level, 50, rng)
+        for path in paths:
+            rows, cols, heights, widths = grid_positions([path])
+            box = octant_to_latlong(path)
+            assert cols[0] == (box.west + 180) / (box.east - box.west)
+            assert rows[0] == (90 - box.north) / (box.north - box.south)
+            assert heights[0] == widths[0] == 1
+
+
+def _assert_cells_match_boxes(paths):
+    rows, cols, heights, widths = grid_positions(paths)
+    boxes = [octant_to_latlong(path) for path in paths]
+    cell_width = min(box.east - box.west for box in boxes)
+    cell_height = min(box.north - box.south for box in boxes)
+    for box, row, col, height, width in zip(boxes, rows, cols, heights, widths):
+        assert box.west == -180 + col * cell_width
+        assert box.east == -180 + (col + width) * cell_width
+        assert box.north == 90 - row * cell_height
+        assert box.south == 90 - (row + height) * cell_height
+
+
+def test_grid_positions_across_45_degrees():
+    # North of 45 degrees the octants at level 20 are twice as wide
+    paths = list(latlon_to_octant([44.99999, 45.00001, 45.00001], [7.6, 7.6, 7.6005], 20))
+    _assert_cells_match_boxes(paths)
+    rows, cols, heights, widths = grid_positions(paths)
+    assert widths.tolist() == [1, 2, 2] and heights.tolist() == [1, 1, 1]
+
+
+def test_grid_positions_mixed_levels():
+    head = "2052706160527351416"
+    _assert_cells_match_boxes([head[:-1], head + "0", head + "3", head[:-2] + "77"])
+
+
+def _jpeg(color, size=64):
+    buffer = io.BytesIO()
+    Image.new("RGB", (size, size), color).save(buffer, "JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def test_mosaic_places_tiles():
+    # 2 | 3 on the top row, 0 | 1 below, all inside octant 2052706160527351416
+    colors = {"0": (255, 0, 0), "1": (0, 255, 0), "2": (0, 0, 255), "3": (255, 255, 255)}
+    head = "2052706160527351416"
+    tiles = {head + digit: _jpeg(color) for digit, color in colors.items()}
+    del tiles[head + "1"]
+
+    mosaic = build_mosaic(tiles)
+    assert mosaic.image.shape == (128, 128, 3) and mosaic.level == 20
+    centers = {"2": (32, 32), "3": (32, 96), "0": (96, 32), "1": (96, 96)}
+    for digit, (y, x) in centers.items():
+        expected = colors[digit] if head + digit in tiles else (0, 0, 0)
+        assert np.abs(mosaic.image[y, x].astype(int) - expected).max() < 8
+
+    small = build_mosaic(tiles, scale=4)
+    assert small.image.shape == (32, 32, 3)
+    assert np.abs(small.image[8, 8].astype(int) - colors["2"]).max() < 8
+
+
+def test_mosaic_spans_wider_tiles():
+    south, north = latlon_to_octant([44.99999, 45.00001], [7.6, 7.6], 20)
+    mosaic = build_mosaic({south: _jpeg((255, 0, 0)), north: _jpeg((0, 0, 255))})
+    assert mosaic.image.shape == (128, 128, 3)
+    assert np.abs(mosaic.image[32, 96].astype(int) - (0, 0, 255)).max() < 8
+    assert np.abs(mosaic.image[96, 32].astype(int) - (255, 0, 0)).max() < 8
+    assert mosaic.image[96, 96].max() == 0
+
+
+def test_mosaic_rejects_bad_input():
+    with pytest.raises(ValueError):
+        build_mosaic({})
+    with pytest.raises(ValueError):
+        build_mosaic({"20527061": _jpeg("red")}, scale=3)
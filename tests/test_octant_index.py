@@ -0,0 +1,50 @@
+from conftest import REGION
+from bulk_columns import decode_bulk_metadata
+from find_overlaps import find_overlaps
+from find_overlaps import read_bulk_metadata
+from octant_index import OctantIndex
+from octant_to_latlong import LatLonBox
+
+
+def _quarters(box):
+    n, s, w, e = box
+    lat, lon = (n + s) / 2, (w + e) / 2
+    return [LatLonBox(n, lat, w, lon), LatLonBox(n, lat, lon, e),
+            LatLonBox(lat, s, w, lon), LatLonBox(lat, s, lon, e)]
+
+
+def test_index_matches_traversal(fake_world):
+    index = OctantIndex.from_overlaps(find_overlaps(REGION, 1000))
+    assert index.levels() == list(range(1, 21))
+
+    fake_world.requests.clear()
+    for box in [REGION] + _quarters(REGION):
+        expected = find_overlaps(box, target_level=20)[20]
+        assert sorted(o.path for o in index.query(box, 20)) == sorted(o.path for o in expected)
+        assert set(index.query(box, 16)) == set(find_overlaps(box, 1000)[16])
+
+
+def test_index_polygon_query(fake_world):
+    import shapely
+
+    n, s, w, e = REGION
+    triangle = shapely.Polygon([(w, s), (e, s), (w, n)])
+    index = OctantIndex.from_overlaps(find_overlaps(REGION, target_level=20))
+    expected = find_overlaps(triangle, target_level=20, min_overlap=0.5)[20]
+    assert sorted(o.path for o in index.query(triangle, 20, min_overlap=0.5)) == \
+        sorted(o.path for o in expected)
+
+
+def test_index_incremental_updates(fake_world):
+    index = OctantIndex()
+    assert index.query(REGION, 20) == []
+    head = min(p for p in fake_world.nodes if len(p) == 16)
+    columns = decode_bulk_metadata(read_bulk_metadata(head, fake_world.epoch(head)))
+    index.add_columns(columns)
+    first = len(index)
+    assert first == len(columns)
+
+    index.add_columns(columns)
+    index.add(find_overlaps(REGION, target_level=20)[20])
+    assert len(index) > first
+    assert len({o.key for o in index.query(REGION, 20)}) == len(index.query(REGION, 20))
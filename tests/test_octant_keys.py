@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from octant_keys import descendant_range
+from octant_keys import key_level
+from octant_keys import pack_path
+from octant_keys import pack_paths
+from octant_keys import parent_key
+from octant_keys import unpack_path
+from octant_keys import unpack_paths
+
+PATHS = ["", "0", "3", "20", "205", "2052706160527351416", "20527061605273514162",
+         "31777777777777777777"]
+
+
+def test_round_trip():
+    for path in PATHS:
+        key = pack_path(path)
+        assert 0 <= key < 1 << 64
+        assert key_level(key) == len(path)
+        assert unpack_path(key) == path
+    keys = pack_paths(PATHS)
+    assert keys.dtype == np.uint64
+    assert keys.tolist() == [pack_path(path) for path in PATHS]
+    assert unpack_paths(keys).tolist() == PATHS
+
+
+def test_invalid_paths():
+    for path in ["4", "28", "0" * 21]:
+        with pytest.raises(ValueError):
+            pack_path(path)
+        with pytest.raises(ValueError):
+            pack_paths(["20", path])
+
+
+def test_keys_sort_depth_first():
+    paths = ["2052", "20527", "2052706", "2053", "205", "3", "20"]
+    assert sorted(paths, key=pack_path) == sorted(paths)
+
+
+def test_parent_and_descendants():
+    key = pack_path("2052706")
+    assert parent_key(key) == pack_path("205270")
+    start, stop = descendant_range(key)
+    for path in ["2052706", "20527061", "20527067777777777777"]:
+        assert start <= pack_path(path) < stop
+    for path in ["2052705", "2052707", "205270"]:
+        assert not start <= pack_path(path) < stop
@@ -0,0 +1,128 @@
+import random
+
+import numpy as np
+import pytest
+
+from octant_keys import pack_path
+from octant_to_latlong import LatLonBox
+from octant_to_latlong import LatLonBoxTrie
+from octant_to_latlong import cover_region
+from octant_to_latlong import latlon_to_octant
+from octant_to_latlong import first_latlonbox_dict
+from octant_to_latlong import octant_to_latlong
+from octant_to_latlong import octant_to_latlong_batch
+
+
+def _random_paths(count, seed=0):
+    rng = random.Random(seed)
+    starts = [path for path in first_latlonbox_dict if len(path) == 2]
+    paths = [path for path in first_latlonbox_dict if path]
+    for _ in range(count):
+        level = rng.randint(3, 20)
+        # Mostly north or south halves, to keep hitting the pole rule.
+        digits = rng.choice(["0145", "2367", "01234567"])
+        paths.append(rng.choice(starts) + "".join(rng.choice(digits) for _ in range(level - 2)))
+    return paths
+
+
+def _boxes(paths):
+    return [tuple(octant_to_latlong(path)) for path in paths]
+
+
+def test_batch_matches_scalar_for_strings_and_keys():
+    paths = _random_paths(2000)
+    expected = _boxes(paths)
+    for batch in (paths, np.array(paths), np.array(paths, dtype="S20"),
+                  np.array([pack_path(path) for path in paths], dtype=np.uint64)):
+        assert list(zip(*octant_to_latlong_batch(batch))) == expected
+
+
+def test_batch_rejects_invalid_paths_like_scalar():
+    for path in ["04", "17", "00"]:
+        with pytest.raises((KeyError, ValueError)):
+            octant_to_latlong(path)
+        with pytest.raises(ValueError):
+            octant_to_latlong_batch(["20", path])
+        with pytest.raises(ValueError):
+            octant_to_latlong_batch(np.array([pack_path("20"), pack_path(path)], dtype=np.uint64))
+
+
+def test_pole_rows_keep_full_longitude_span():
+    paths = ["20" + "2" * 18, "02" + "0" * 18, "3122"]
+    n, s, w, e = octant_to_latlong_batch(paths)
+    assert (n[0], s[1]) == (90, -90)
+    for i, path in enumerate(paths):
+        top = first_latlonbox_dict[path[:2]]
+        assert (w[i], e[i]) == (top.west, top.east)
+    assert list(zip(n, s, w, e)) == _boxes(paths)
+
+
+def test_prefix_shortcut():
+    paths = [path for path in _random_paths(500, seed=1) if path.startswith("20")]
+    assert list(zip(*octant_to_latlong_batch(paths, prefix="20"))) == _boxes(paths)
+
+
+def test_trie_matches_scalar_and_reuses_prefixes():
+    trie = LatLonBoxTrie()
+    paths = _random_paths(300, seed=2)
+    for path in paths + paths:
+        assert octant_to_latlong(path, cache=trie) == octant_to_latlong(path)
+
+    trie = LatLonBoxTrie()
+    trie.lookup("2052706160527351416")
+    trie.lookup("20527061605273514162")
+    trie.lookup("2052706160527351416")
+    assert trie.stats()["misses"] == 2
+    assert trie.stats()["hits"] == 1
+    assert len(trie) == 20
+
+
+def test_trie_rejects_invalid_paths_unchanged():
+    trie = LatLonBoxTrie(max_entries=30)
+    trie.lookup("20527061")
+    for path in ["2052706199", "92"]:
+        with pytest.raises(ValueError):
+            trie.lookup(path)
+    trie.lookup("2052706")
+    assert len(trie) == 8
+    assert trie.stats()["misses"] == 1 and trie.stats()["hits"] == 1
+    for path in _random_paths(100, seed=4):
+        trie.lookup(path)
+        assert len(trie) <= 30
+
+
+def test_trie_is_bounded():
+    trie = LatLonBoxTrie(max_entries=50)
+    for path in _random_paths(200, seed=3):
+        assert trie.lookup(path) == octant_to_latlong(path)
+        assert len(trie) <= 50
+    assert trie.stats()["memory_bytes"] > 0
+
+
+def test_cover_region_matches_box_overlaps():
+    region = LatLonBox(north=37.4206, south=37.4197, west=-122.0850, east=-122.0833)
+    for level in (1, 2, 5, 12, 20):
+        paths = cover_region(region, level)
+        assert paths == sorted(paths)
+        assert all(octant_to_latlong(path).overlaps_with(region) for path in paths)
+        parents = cover_region(region, level - 1) if level > 1 else [""]
+        children = [parent + digit for parent in parents for digit in "0123"] if level > 2 else []
+        outside = [path for path in children if path not in paths]
+        assert not any(octant_to_latlong(path).overlaps_with(region) for path in outside)
+    assert len(cover_region(region, 20)) == len(set(cover_region(region, 20)))
+
+
+def test_latlon_to_octant_inverts_octant_to_latlong():
+    rng = np.random.default_rng(0)
+    lats = np.concatenate([rng.uniform(-90, 90, 500), [90, -90, 0, 89.9999, -89.9999]])
+    lons = np.concatenate([rng.uniform(-180, 180, 500), [180, -180, 0, 12.5, -170.1]])
+    for level in (1, 2, 3, 9, 20):
+        paths = latlon_to_octant(lats, lons, level)
+        keys = latlon_to_octant(lats, lons, level, packed=True)
+        assert [pack_path(path) for path in paths] == keys.tolist()
+        for lat, lon, path in zip(lats, lons, paths):
+            box = octant_to_latlong(path)
+            assert len(path) == level
+            assert box.south <= lat <= box.north and box.west <= lon <= box.east
+    paths = latlon_to_octant([37.42], [-122.084], 20)
+    assert paths[0] in cover_region(LatLonBox(37.42, 37.42, -122.084, -122.084), 20)
@@ -0,0 +1,50 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import bulk_payloads
+from bulk_metadata import NODE_FIELDS
+from bulk_metadata import LazyBulkMetadata
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Parses the payloads in argv[1] and prints the node columns as json.
+DUMP = """
+import json, sys
+from google.protobuf.internal import api_implementation
+from bulk_metadata import NODE_FIELDS, node_column
+from proto.rocktree_pb2 import BulkMetadata
+
+result = {"backend": api_implementation.Type(), "packets": []}
+for data in json.load(open(sys.argv[1])):
+    bulk = BulkMetadata()
+    bulk.ParseFromString(bytes.fromhex(data))
+    packet = {name: node_column(bulk, name).tolist() for name in NODE_FIELDS}
+    packet["head"] = [bulk.head_node_key.path, bulk.head_node_key.epoch]
+    result["packets"].append(packet)
+print(json.dumps(result))
+"""
+
+
+@pytest.mark.parametrize("backend", ["python", "upb", "cpp"])
+def test_backends_agree_with_wire_decoder(backend, tmp_path):
+    payloads = bulk_payloads()
+    payload_file = tmp_path / "payloads.json"
+    payload_file.write_text(json.dumps([data.hex() for data in payloads]))
+    env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+    result = subprocess.run([sys.executable, "-c", DUMP, str(payload_file)],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode:
+        pytest.skip(f"protobuf backend {backend} is not available")
+    result = json.loads(result.stdout)
+    assert result["backend"] == backend
+
+    for data, packet in zip(payloads, result["packets"], strict=True):
+        lazy = LazyBulkMetadata(data)
+        assert packet["head"] == list(lazy.head_node_key)
+        for name in NODE_FIELDS:
+            assert packet[name] == lazy.node_column(name).tolist(), name
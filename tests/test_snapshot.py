@@ -0,0 +1,61 @@
+import pytest
+
+from conftest import REGION
+from conftest import paths_by_level
+from find_overlaps import find_overlaps
+from octant_to_latlong import LatLonBox
+from snapshot import Snapshot
+from snapshot import export_snapshot
+
+
+def test_snapshot_answers_queries_offline(fake_world, tmp_path):
+    prefix = min(p for p in fake_world.nodes if len(p) == 8)
+    filename = tmp_path / "city.snapshot"
+    export_snapshot(filename, prefix)
+
+    snapshot = Snapshot(filename)
+    assert snapshot.prefix == prefix
+    assert len(snapshot) == len(fake_world.nodes)
+
+    n, s, w, e = REGION
+    queries = [REGION, LatLonBox(n, (n + s) / 2, w, (w + e) / 2)]
+    fake_world.requests.clear()
+    expected = [paths_by_level(find_overlaps(bbox, 10)) for bbox in queries]
+    expected += [paths_by_level(find_overlaps(bbox, target_level=20)) for bbox in queries]
+
+    fake_world.requests.clear()
+    results = [paths_by_level(find_overlaps(bbox, 10, snapshot=snapshot)) for bbox in queries]
+    results += [paths_by_level(find_overlaps(bbox, target_level=20, snapshot=snapshot)) for bbox in queries]
+    assert results == expected
+    assert fake_world.requests == []
+
+
+def test_snapshot_rejects_what_it_does_not_hold(fake_world, tmp_path):
+    prefix = min(p for p in fake_world.nodes if len(p) == 8)
+    filename = tmp_path / "city.snapshot"
+    export_snapshot(filename, prefix)
+    snapshot = Snapshot(filename)
+
+    epoch = fake_world.epoch(prefix)
+    assert len(snapshot.bulk_columns(prefix, epoch))
+    assert len(snapshot.bulk_columns(prefix[:4]))
+    with pytest.raises(ValueError, match="epoch"):
+        snapshot.bulk_columns(prefix, epoch + 1)
+    with pytest.raises(ValueError, match="outside"):
+        snapshot.bulk_columns(prefix[:4] + "7777")
+    with pytest.raises(ValueError, match="prefix"):
+        find_overlaps(LatLonBox(-10, -11, 10, 11), target_level=20, snapshot=snapshot)
+
+
+def test_snapshot_keeps_twins_and_neighbours(twin_world, tmp_path):
+    # Octants below the prefix's altitude twin, or touching its edges,
+    # overlap the same regions and must be exported too
+    prefix = min(p for p in twin_world.nodes if len(p) == 8)
+    filename = tmp_path / "city.snapshot"
+    export_snapshot(filename, prefix)
+    snapshot = Snapshot(filename)
+
+    expected = find_overlaps(REGION, target_level=20)
+    assert any(o.path[2] in "4567" for o in expected[20])
+    assert paths_by_level(find_overlaps(REGION, target_level=20, snapshot=snapshot)) == \
+        paths_by_level(expected)
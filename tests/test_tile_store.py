@@ -0,0 +1,46 @@
+from downloader import TileKey
+from tile_store import TileStore
+
+KEY = TileKey("20527061605273514160", 990, 350, 1036419)
+
+
+def test_round_trip_and_dedup(tmp_path):
+    store = TileStore(tmp_path)
+    assert store.get(KEY) is None
+    digest = store.put(KEY, b"payload")
+    store.put(KEY._replace(timestamp=1), b"payload")
+    store.put(KEY, b"\xff\xd8jpeg", "jpeg")
+    assert store.get(KEY) == b"payload"
+    assert store.get(KEY, "jpeg") == b"\xff\xd8jpeg"
+    assert store.stats() == {"hits": 2, "misses": 1, "corrupt": 0, "entries": 2,
+                             "bytes": len(b"payload") + len(b"\xff\xd8jpeg")}
+    store.close()
+
+    store = TileStore(tmp_path)
+    assert store.get(KEY._replace(timestamp=1)) == b"payload"
+    assert (tmp_path / "objects" / digest[:2] / digest[2:]).read_bytes() == b"payload"
+
+
+def test_corrupt_blob_is_a_miss(tmp_path):
+    store = TileStore(tmp_path)
+    digest = store.put(KEY, b"payload")
+    (tmp_path / "objects" / digest[:2] / digest[2:]).write_bytes(b"paylaod")
+    assert store.get(KEY) is None
+    assert store.stats()["corrupt"] == 1
+    assert store.stats()["entries"] == 0
+    assert not (tmp_path / "objects" / digest[:2] / digest[2:]).exists()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    store = TileStore(tmp_path, max_bytes=25)
+    keys = [KEY._replace(path=str(i)) for i in range(3)]
+    store.put(keys[0], b"0" * 10)
+    store.put(keys[1], b"1" * 10)
+    store.get(keys[0])
+    store.put(keys[2], b"2" * 10)
+    assert store.get(keys[1]) is None
+    assert store.get(keys[0]) == b"0" * 10
+    assert store.get(keys[2]) == b"2" * 10
+    assert store.stats()["bytes"] == 20
+    store.close()
+    assert TileStore(tmp_path, max_bytes=25).stats()["bytes"] == 20
@@ -0,0 +1,39 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import transport
+from transport import get_transport
+from transport import set_transport
+
+
+def test_reads_from_stand_in_server(fake_world):
+    transport = get_transport()
+    assert transport.read("earth/PlanetoidMetadata") == fake_world.planetoid_metadata()
+    with pytest.raises(requests.HTTPError):
+        transport.read("earth/BulkMetadata/pb=!1m2!1s7!2u1")
+    assert fake_world.requests == [
+        "earth/PlanetoidMetadata",
+        "earth/BulkMetadata/pb=!1m2!1s7!2u1",
+    ]
+
+
+def test_concurrent_callers_share_one_transport(monkeypatch):
+    created = []
+
+    class SlowTransport:
+        def __init__(self):
+            time.sleep(0.05)
+            created.append(self)
+
+    monkeypatch.setattr(transport, "Transport", SlowTransport)
+    previous = set_transport(None)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: get_transport(), range(8)))
+    finally:
+        set_transport(previous)
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
@@ -0,0 +1,102 @@
+from collections import defaultdict
+
+import pytest
+
+from conftest import REGION
+from conftest import paths_by_level
+from find_overlaps import find_covering
+from find_overlaps import find_overlaps
+from find_overlaps import find_overlaps_many
+from find_overlaps import iter_overlaps
+from octant_to_latlong import LatLonBox
+
+
+def test_find_overlaps_reaches_level_20(fake_world):
+    overlaps = find_overlaps(REGION, 200)
+    expected = sorted(p for p in fake_world.nodes if len(p) == 20)
+    assert sorted(o.path for o in overlaps[20]) == expected
+
+
+def test_concurrent_matches_serial(fake_world):
+    serial = find_overlaps(REGION, 200)
+    assert paths_by_level(find_overlaps(REGION, 200, concurrency=8)) == paths_by_level(serial)
+    assert paths_by_level(find_overlaps(REGION, 10, concurrency=8)) == paths_by_level(find_overlaps(REGION, 10))
+
+
+def test_find_overlaps_many_matches_single_queries(fake_world):
+    n, s, w, e = REGION
+    bboxes = [
+        REGION,
+        LatLonBox(n, (n + s) / 2, w, (w + e) / 2),
+        LatLonBox((n + s) / 2, s, (w + e) / 2, e),
+        LatLonBox(n - 0.0001, n - 0.0002, w + 0.0001, w + 0.0002),
+    ]
+    for max_octants in (200, 10):
+        expected = [paths_by_level(find_overlaps(bbox, max_octants)) for bbox in bboxes]
+        fake_world.requests.clear()
+        results = find_overlaps_many(bboxes, max_octants, concurrency=4)
+        assert [paths_by_level(result) for result in results] == expected
+        bulk_requests = [r for r in fake_world.requests if "BulkMetadata" in r]
+        assert len(bulk_requests) == len(set(bulk_requests))
+
+
+def test_polygon_prunes_tiles_outside_footprint(fake_world):
+    shapely = pytest.importorskip("shapely")
+    n, s, w, e = REGION
+    footprint = shapely.Polygon([(w, s), (e, s), (e, (n + s) / 2),
+                                 ((w + e) / 2, (n + s) / 2), ((w + e) / 2, n), (w, n)])
+    assert paths_by_level(find_overlaps(shapely.box(w, s, e, n), 200)) == paths_by_level(find_overlaps(REGION, 200))
+
+    tiles = {octant.path for octant in find_overlaps(footprint, 200)[20]}
+    assert 0 < len(tiles) < len(find_overlaps(REGION, 200)[20])
+    for octant in find_overlaps(REGION, 200)[20]:
+        bn, bs, bw, be = octant.bbox
+        assert (octant.path in tiles) == shapely.box(bw, bs, be, bn).intersects(footprint)
+
+    inside = find_overlaps(footprint, 200, min_overlap=1.0)[20]
+    assert 0 < len(inside) < len(tiles)
+    for octant in inside:
+        bn, bs, bw, be = octant.bbox
+        assert footprint.covers(shapely.box(bw, bs, be, bn))
+
+
+def test_target_level_lists_every_octant(fake_world):
+    overlaps = find_overlaps(REGION, target_level=20)
+    assert list(overlaps) == [20]
+    assert paths_by_level(overlaps)[20] == paths_by_level(find_overlaps(REGION, 10000))[20]
+    assert overlaps.bulk_fetches == 6
+
+    overlaps = find_overlaps(REGION, target_level=14)
+    assert sorted(o.path for o in overlaps[14]) == sorted(p for p in fake_world.nodes if len(p) == 14)
+    assert overlaps.bulk_fetches == 4
+
+
+def test_iter_overlaps_streams_octants(fake_world):
+    octants = iter_overlaps(REGION, target_level=20)
+    first = next(octants)
+    assert first.level == 20
+    bulk_requests = [r for r in fake_world.requests if "BulkMetadata" in r]
+    assert len(bulk_requests) < 6
+    paths = [first.path] + [octant.path for octant in octants]
+    assert paths == paths_by_level(find_overlaps(REGION, target_level=20))[20]
+
+    streamed = defaultdict(list)
+    for octant in iter_overlaps(REGION, 10, concurrency=4):
+        streamed[octant.level].append(octant.path)
+    assert streamed == paths_by_level(find_overlaps(REGION, 10))
+
+
+def test_find_covering_confirms_candidates(fake_world):
+    covering = find_covering(REGION, 20)
+    assert covering and all(covering.values())
+    octants = [octant.path for octants in covering.values() for octant in octants]
+    assert sorted(octants) == sorted(p for p in fake_world.nodes if len(p) == 20)
+
+
+def test_find_covering_reads_no_extra_packets(fake_world):
+    overlaps = find_overlaps(REGION, target_level=20)
+    fake_world.requests.clear()
+    find_covering(REGION, 20)
+    bulk_requests = [r for r in fake_world.requests if "BulkMetadata" in r]
+    assert len(bulk_requests) == overlaps.bulk_fetches
+    assert len(set(bulk_requests)) == len(bulk_requests)
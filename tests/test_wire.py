@@ -0,0 +1,87 @@
+import pytest
+
+from conftest import bulk_payloads
+from conftest import rich_bulk_metadata
+from find_overlaps import parse_path_and_flags
+from proto.rocktree_pb2 import BulkMetadata
+from proto.rocktree_pb2 import NodeData
+from proto.rocktree_pb2 import Texture
+from wire import LENGTH_DELIMITED
+from wire import VARINT
+from wire import decode_varint
+from wire import iter_bulk_nodes
+from wire import iter_fields
+from wire import iter_textures
+
+
+def _expected_nodes(data):
+    bulk = BulkMetadata()
+    bulk.ParseFromString(data)
+    for node in bulk.node_metadata:
+        path, flags = parse_path_and_flags(node.path_and_flags)
+        yield (bulk.head_node_key.path + path, flags, node.epoch,
+               node.bulk_metadata_epoch or bulk.head_node_key.epoch,
+               node.imagery_epoch or bulk.default_imagery_epoch)
+
+
+def test_bulk_nodes_match_protobuf():
+    for data in bulk_payloads():
+        assert [tuple(node) for node in iter_bulk_nodes(data)] == list(_expected_nodes(data))
+        assert list(iter_bulk_nodes(memoryview(data))) == list(iter_bulk_nodes(data))
+
+
+def test_bulk_nodes_without_defaults():
+    bulk = BulkMetadata()
+    bulk.ParseFromString(rich_bulk_metadata())
+    nodes = list(iter_bulk_nodes(rich_bulk_metadata(), defaults=False))
+    assert [node.imagery_epoch for node in nodes] == [n.imagery_epoch for n in bulk.node_metadata]
+    assert [node.bulk_metadata_epoch for node in nodes] == \
+        [n.bulk_metadata_epoch for n in bulk.node_metadata]
+    assert nodes[0].imagery_epoch == nodes[0].bulk_metadata_epoch == 0
+
+
+def test_fields_are_views_and_unknown_fields_skip():
+    # field 1 varint, unknown field 9 length-delimited, field 3 fixed32, field 2 string
+    data = b"\x08\x96\x01" + b"\x4a\x03abc" + b"\x1d\x00\x00\x80\x3f" + b"\x12\x02hi"
+    fields = list(iter_fields(data))
+    assert [(field, wire_type) for field, wire_type, _ in fields] == \
+        [(1, VARINT), (9, LENGTH_DELIMITED), (3, 5), (2, LENGTH_DELIMITED)]
+    assert fields[0][2] == 150
+    assert bytes(fields[1][2]) == b"abc" and fields[1][2].obj is data
+    assert bytes(fields[3][2]) == b"hi"
+
+
+def test_malformed_input():
+    assert decode_varint(b"\xff" * 9 + b"\x01", 0) == (2 ** 64 - 1, 10)
+    with pytest.raises(ValueError):
+        decode_varint(b"\xff" * 11, 0)
+    with pytest.raises(ValueError):
+        list(iter_fields(b"\x12\x05ab"))
+    with pytest.raises(ValueError):
+        list(iter_fields(b"\x0b"))
+    with pytest.raises(ValueError):
+        list(iter_bulk_nodes(rich_bulk_metadata()[:-20]))
+
+
+def test_textures_match_protobuf():
+    node = NodeData()
+    node.matrix_globe_from_mesh.extend([1.0] * 16)
+    for i in range(3):
+        mesh = node.meshes.add()
+        mesh.vertices = bytes(300)
+        mesh.mesh_id = i
+        for j in range(i):
+            texture = mesh.texture.add()
+            texture.data.append(b"\xff\xd8" + bytes([i, j]) * 100)
+            texture.format = Texture.JPG if j == 0 else Texture.DXT1
+            if j:
+                texture.width, texture.height = 128, 64
+    mesh.texture.add()
+    data = node.SerializeToString()
+
+    textures = list(iter_textures(data))
+    expected = [(i, t.data[0] if t.data else None, t.format, t.width, t.height)
+                for i, mesh in enumerate(node.meshes) for t in mesh.texture]
+    assert [(t.mesh, None if t.data is None else bytes(t.data), t.format, t.width, t.height)
+            for t in textures] == expected
+    assert textures[0].data.obj is data
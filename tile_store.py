@@ -0,0 +1,138 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from metadata_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_TILE_DIR = Path(DEFAULT_CACHE_DIR) / "tiles"
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs (digest),
+    PRIMARY KEY (key, kind)
+);
+CREATE INDEX IF NOT EXISTS refs_digest ON refs (digest);
+CREATE INDEX IF NOT EXISTS blobs_used ON blobs (used);
+"""
+
+
+def key_string(key):
+    """Store key of a `TileKey` or any other tuple of URL parameters."""
+    return key if isinstance(key, str) else "/".join(map(str, key))
+
+
+class TileStore:
+    """Content-addressed on-disk store of NodeData payloads and extracted images.
+
+    Blobs are saved once per sha256 digest under `directory/objects` and
+    checked against it on every read; a corrupt blob counts as a miss and is
+    dropped. An sqlite index maps (key, kind) to digests and evicts the least
+    recently used blobs beyond `max_bytes`, against a running total of the
+    stored bytes. Instances are safe to share between threads, but not
+    between processes writing to the same directory.
+    """
+
+    def __init__(self, directory=DEFAULT_TILE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.directory / "index.sqlite", check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._bytes, = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+
+    def _file(self, digest):
+        return self.directory / "objects" / digest[:2] / digest[2:]
+
+    def get(self, key, kind="raw"):
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM refs WHERE key = ? AND kind = ?",
+                                   (key_string(key), kind)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            digest, = row
+            try:
+                data = self._file(digest).read_bytes()
+            except FileNotFoundError:
+                data = None
+            if data is None or hashlib.sha256(data).hexdigest() != digest:
+                self.corrupt += 1
+                self.misses += 1
+                with self._db:
+                    self._remove(digest)
+                return None
+            with self._db:
+                self._db.execute("UPDATE blobs SET used = ? WHERE digest = ?", (time.time(), digest))
+            self.hits += 1
+            return data
+
+    def put(self, key, data, kind="raw"):
+        """Store `data` under (key, kind) and return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            file = self._file(digest)
+            if not file.exists():
+                file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = file.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, file)
+            with self._db:
+                known = self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                self._db.execute("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?)",
+                                 (digest, len(data), time.time()))
+                if known is None:
+                    self._bytes += len(data)
+                self._db.execute("INSERT OR REPLACE INTO refs VALUES (?, ?, ?)",
+                                 (key_string(key), kind, digest))
+                self._evict()
+        return digest
+
+    def stats(self):
+        with self._lock:
+            entries, = self._db.execute("SELECT COUNT(*) FROM blobs").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "corrupt": self.corrupt,
+                "entries": entries,
+                "bytes": self._bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _evict(self):
+        if self._bytes <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT digest FROM blobs ORDER BY used").fetchall()
+        for digest, in rows[:-1]:
+            self._remove(digest)
+            if self._bytes <= self.max_bytes:
+                break
+
+    def _remove(self, digest):
+        row = self._db.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is not None:
+            self._bytes -= row[0]
+        self._db.execute("DELETE FROM refs WHERE digest = ?", (digest,))
+        self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        try:
+            self._file(digest).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,65 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://kh.google.com/rt/"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Referer': 'https://earth.google.com/'
+}
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_POOL_SIZE = 16
+
+
+class Transport:
+    """Keep-alive HTTP session shared by every rocktree request.
+
+    Resources are given relative to `base_url`, e.g. "earth/PlanetoidMetadata"
+    or "tm/earth/NodeData/pb=...", so tests can point the whole program at a
+    local stand-in server by swapping the base URL.
+    """
+
+    def __init__(self, base_url=BASE_URL, headers=HEADERS, timeout=DEFAULT_TIMEOUT,
+                 pool_size=DEFAULT_POOL_SIZE):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, resource):
+        return self.base_url + resource
+
+    def get(self, resource):
+        return self.session.get(self.url(resource), timeout=self.timeout)
+
+    def read(self, resource):
+        response = self.get(resource)
+        response.raise_for_status()
+        return response.content
+
+    def close(self):
+        self.session.close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = Transport()
+        return _transport
+
+
+def set_transport(transport):
+    """Install `transport` for all later fetches and return the previous one."""
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous